@@ -1,68 +1,74 @@
 """Configuration schemas for use with the SCConfigManager class."""
+from types import MappingProxyType
 
 
 class ConfigSchema:
     """Base class for configuration schemas."""
 
-    def __init__(self):
-        self.default = {
-            "AmberAPI": {
-                "APIKey": "<Your API Key Here>",
-                "BaseUrl": "https://api.amber.com.au/v1",
-                "Timeout": 10,
-            },
-            "Files": {
-                "LogfileName": "example.log",
-                "LogfileMaxLines": 5000,
-                "LogfileVerbosity": "summary",
-                "ConsoleVerbosity": "summary",
-            },
-            "Email": {
-                "EnableEmail": False,
-                "SendEmailsTo": "<Your email address here>",
-                "SMTPServer": "<Your SMTP server here>",
-                "SMTPPort": 587,
-                "SMTPUsername": "<Your SMTP username here>",
-                "SMTPPassword": "<Your SMTP password here>",
-                "SubjectPrefix": None,
-            },
-        }
+    DEFAULT = MappingProxyType({
+        "AmberAPI": {
+            "APIKey": "<Your API Key Here>",
+            "BaseUrl": "https://api.amber.com.au/v1",
+            "Timeout": 10,
+        },
+        "Files": {
+            "LogfileName": "example.log",
+            "LogfileMaxLines": 5000,
+            "LogfileVerbosity": "summary",
+            "ConsoleVerbosity": "summary",
+        },
+        "Email": {
+            "EnableEmail": False,
+            "SendEmailsTo": "<Your email address here>",
+            "SMTPServer": "<Your SMTP server here>",
+            "SMTPPort": 587,
+            "SMTPUsername": "<Your SMTP username here>",
+            "SMTPPassword": "<Your SMTP password here>",
+            "SubjectPrefix": None,
+        },
+    })
 
-        self.placeholders = {
-            "AmberAPI": {
-                "APIKey": "<Your API Key Here>",
-            },
-            "Email": {
-                "SMTPUsername": "<Your SMTP username here>",
-                "SMTPPassword": "<Your SMTP password here>",
-            }
+    PLACEHOLDERS = MappingProxyType({
+        "AmberAPI": {
+            "APIKey": "<Your API Key Here>",
+        },
+        "Email": {
+            "SMTPUsername": "<Your SMTP username here>",
+            "SMTPPassword": "<Your SMTP password here>",
         }
+    })
 
-        self.validation = {
-            "AmberAPI": {
-                "type": "dict",
-                "schema": {
-                    "APIKey": {"type": "string", "required": False, "nullable": True},
-                    "BaseUrl": {"type": "string", "required": True},
-                    "Timeout": {"type": "number", "required": True, "min": 5, "max": 60},
-                },
+    VALIDATION = MappingProxyType({
+        "AmberAPI": {
+            "type": "dict",
+            "schema": {
+                "APIKey": {"type": "string", "required": False, "nullable": True},
+                "BaseUrl": {"type": "string", "required": True},
+                "Timeout": {"type": "number", "required": True, "min": 5, "max": 60},
             },
-            "ShellyDevices": {
-                "schema": {
-                    "Devices": {
+        },
+        "ShellyDevices": {
+            "schema": {
+                "Devices": {
+                    "schema": {
                         "schema": {
-                            "schema": {
-                                "Outputs": {
+                            "Outputs": {
+                                "schema": {
                                     "schema": {
-                                        "schema": {
-                                            "Colour": {"type": "string", "required": False, "nullable": True},
-                                            "Size": {"type": "string", "required": False, "nullable": True},
-                                        },
+                                        "Colour": {"type": "string", "required": False, "nullable": True},
+                                        "Size": {"type": "string", "required": False, "nullable": True},
                                     },
                                 },
                             },
                         },
                     },
-                }
+                },
             }
         }
+    })
+
+    def __init__(self):
+        """Bind the shared, read-only class-level schemas to the instance for backwards compatibility."""
+        self.default = type(self).DEFAULT
+        self.placeholders = type(self).PLACEHOLDERS
+        self.validation = type(self).VALIDATION
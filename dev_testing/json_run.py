@@ -33,10 +33,6 @@ def test_json_encoder():
 
     print(f"Original Data Object:\n{data_obj}\n")
 
-    # Make a JSON ready version of the object
-    json_ready_data_obj = JSONEncoder.ready_dict_for_json(data_obj)
-    print(f"JSON Ready Data Object:\n{json_ready_data_obj}\n")
-
     # Make a JSON string from the object
     json_string = JSONEncoder.serialise_to_json(data_obj)
     print(f"JSON String:\n{json_string}\n")
@@ -3,7 +3,6 @@
 import datetime as dt  # noqa: F401
 import platform
 import sys
-from time import sleep
 
 from config_schemas import ConfigSchema
 
@@ -22,17 +21,14 @@ def test_reportable_issue(logger: SCLogger):
     issue = "Test issue"
     send_delay = 4  # seconds
     message = f"This is a test reportable issue for {entity} - {issue}"
-    loop_target = 15
 
     logger.report_notifiable_issue(entity, issue, send_delay, message)
 
-    # Now loop for 10 seconds, logging a message every 1 seconds
-    for i in range(loop_target):
-        print(f"Loop iteration {i + 1}/{loop_target}")
-        sleep(1)
-        if logger.report_notifiable_issue(entity, issue, send_delay, message):
-            print("Email sent for reportable issue.")
-            logger.clear_notifiable_issue(entity, issue)
+    # Now wait for the send delay to pass, rather than polling every second
+    print(f"Waiting {send_delay} seconds for the issue to become notifiable...")
+    if logger.wait_notifiable_issue(entity, issue, message):
+        print("Email sent for reportable issue.")
+        logger.clear_notifiable_issue(entity, issue)
 
 
 def main():
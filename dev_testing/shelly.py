@@ -4,6 +4,7 @@ import platform
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from config_schemas import ConfigSchema
 
@@ -56,7 +57,9 @@ def test_spello_control(config, logger):
     # meter_identity = "Solar Pump Meter"
 
     shelly_control = create_shelly_control(config, logger)
-    assert shelly_control is not None, "Shelly control should be initialized."
+    if shelly_control is None:
+        msg = "Shelly control should be initialized."
+        raise RuntimeError(msg)
     try:
         device = shelly_control.get_device(device_identity)
         device_status = shelly_control.get_device_status(device)
@@ -78,11 +81,8 @@ def test_spello_control(config, logger):
         current_state = output_obj.get("State", False)  # Default to False if State is not found
         print(f"#1 Output status for {output_identity}: Is Online: {is_online}, Current State: {current_state}")
 
-        print("Waiting 7 seconds before changing the output state...")
-        for i in range(7):
-            time.sleep(1)  # Short delay to ensure the device is ready for the next command
-            print(f"{i + 1}...", end="", flush=True)
-        print()
+        print("Waiting 7 seconds before changing the output state...", flush=True)
+        time.sleep(7)  # Delay to ensure the device is ready for the next command
 
         print("Attempting to change the output state...")
         shelly_control.change_output(output_identity, not current_state)
@@ -109,7 +109,9 @@ def test_get_status(config, logger):
     output_name = "Sydney Dev A O1"
 
     shelly_control = create_shelly_control(config, logger)
-    assert shelly_control is not None, "Shelly control should be initialized."
+    if shelly_control is None:
+        msg = "Shelly control should be initialized."
+        raise RuntimeError(msg)
     try:
         output = shelly_control.get_device_component("output", output_name)
     except RuntimeError as e:
@@ -119,6 +121,7 @@ def test_get_status(config, logger):
         print(f"Timeout error getting device: {e}", file=sys.stderr)
         sys.exit(1)
     else:
+        next_tick = time.monotonic()  # Deadline for the next pass, so time spent in the loop body doesn't add drift
         while loop_count < max_loops:
             # Refresh the status of all devices
             shelly_control.refresh_all_device_statuses()
@@ -127,7 +130,8 @@ def test_get_status(config, logger):
 
             print(f"{output_name} State: {output_state}.")
 
-            time.sleep(loop_delay)
+            next_tick += loop_delay
+            time.sleep(max(0.0, next_tick - time.monotonic()))
             loop_count += 1
 
 
@@ -143,7 +147,9 @@ def test_new_meter(config, logger):  # noqa: PLR0914
     output_name = "Sydney Panel EM1 O1"
 
     shelly_control = create_shelly_control(config, logger)
-    assert shelly_control is not None, "Shelly control should be initialized."
+    if shelly_control is None:
+        msg = "Shelly control should be initialized."
+        raise RuntimeError(msg)
     try:
         meter_device = shelly_control.get_device(meter_device_name)
         output = shelly_control.get_device_component("output", output_name)
@@ -156,6 +162,7 @@ def test_new_meter(config, logger):  # noqa: PLR0914
         print(f"Timeout error getting device: {e}", file=sys.stderr)
         sys.exit(1)
     else:
+        next_tick = time.monotonic()  # Deadline for the next pass, so time spent in the loop body doesn't add drift
         while loop_count < max_loops:
             # Refresh the status of all devices
             shelly_control.get_device_status(meter_device)
@@ -171,7 +178,8 @@ def test_new_meter(config, logger):  # noqa: PLR0914
             print(f"{meter2_name} Volts: {meter2_volts}, Power: {meter2_power}, Energy: {meter2_energy}.")
             print(f"{output_name} State: {output.get('State', False)}.")
 
-            time.sleep(loop_delay)
+            next_tick += loop_delay
+            time.sleep(max(0.0, next_tick - time.monotonic()))
             loop_count += 1
 
 
@@ -187,7 +195,9 @@ def test_get_status_and_temp(config, logger):  # noqa: PLR0914
     pool_probe_name = "Temp Pool Water"
 
     shelly_control = create_shelly_control(config, logger)
-    assert shelly_control is not None, "Shelly control should be initialized."
+    if shelly_control is None:
+        msg = "Shelly control should be initialized."
+        raise RuntimeError(msg)
     try:
         device = shelly_control.get_device(device_name)
         pump_output = shelly_control.get_device_component("output", pump_output_name)
@@ -201,6 +211,7 @@ def test_get_status_and_temp(config, logger):  # noqa: PLR0914
         print(f"Timeout error getting device: {e}", file=sys.stderr)
         sys.exit(1)
     else:
+        next_tick = time.monotonic()  # Deadline for the next pass, so time spent in the loop body doesn't add drift
         while loop_count < max_loops:
             # Refresh the status of all devices
             shelly_control.refresh_all_device_statuses()
@@ -217,13 +228,19 @@ def test_get_status_and_temp(config, logger):  # noqa: PLR0914
 
             internal_probe_reading = internal_probe.get("Temperature", None)
 
-            print(f"{device_name} Temperature: {device_temp}°C.")
-            print(f"{pump_output_name} State: {pump_state}.")
-            print(f"    {roof_probe_name} (ID: {roof_probe_id}) reading: {roof_probe_reading}°C last updated at {roof_time}")
-            print(f"    {pool_probe_name} (ID: {pool_probe_id}) reading: {pool_probe_reading}°C last updated at {pool_time}")
-            print(f"    {device_name} Internal Probe reading: {internal_probe_reading}°C")
-
-            time.sleep(loop_delay)
+            # Write the whole status block in one go rather than one print per line
+            lines = [
+                f"{device_name} Temperature: {device_temp}°C.",
+                f"{pump_output_name} State: {pump_state}.",
+                f"    {roof_probe_name} (ID: {roof_probe_id}) reading: {roof_probe_reading}°C last updated at {roof_time}",
+                f"    {pool_probe_name} (ID: {pool_probe_id}) reading: {pool_probe_reading}°C last updated at {pool_time}",
+                f"    {device_name} Internal Probe reading: {internal_probe_reading}°C",
+            ]
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+            next_tick += loop_delay
+            time.sleep(max(0.0, next_tick - time.monotonic()))
             loop_count += 1
 
 
@@ -235,27 +252,35 @@ def test_shelly_loop(config: SCConfigManager, logger: SCLogger):
     wake_event = threading.Event()
 
     shelly_control = create_shelly_control(config, logger, wake_event)
-    assert shelly_control is not None, "Shelly control should be initialized."
+    if shelly_control is None:
+        msg = "Shelly control should be initialized."
+        raise RuntimeError(msg)
 
     # print(shelly_control.print_device_status())
 
     last_check = config.get_config_file_last_modified()
     print(f"Starting Shelly loop test. Logging level = {logger.file_verbosity}")
+    next_tick = time.monotonic()  # Deadline for the next pass, so time spent in the loop body doesn't add drift
     while loop_count < max_loops:
         print(f"Checking for configuration file changes... (Loop {loop_count + 1}/{max_loops})")
         config_timestamp = config.check_for_config_changes(last_check)  # pyright: ignore[reportArgumentType]
         if config_timestamp:
+            # Only re-apply the settings whose config section actually changed
+            changed_sections = config.get_changed_sections()
             try:
-                logger_settings = config.get_logger_settings()
-                logger.initialise_settings(logger_settings)
+                if "Files" in changed_sections:
+                    logger_settings = config.get_logger_settings()
+                    logger.initialise_settings(logger_settings)
 
-                email_settings = config.get_email_settings()
-                if email_settings is not None:
-                    logger.register_email_settings(email_settings)
+                if "Email" in changed_sections:
+                    email_settings = config.get_email_settings()
+                    if email_settings is not None:
+                        logger.register_email_settings(email_settings)
 
-                shelly_settings = config.get_shelly_settings()
-                if shelly_settings is not None:
-                    shelly_control.initialize_settings(shelly_settings)
+                if "ShellyDevices" in changed_sections:
+                    shelly_settings = config.get_shelly_settings()
+                    if shelly_settings is not None:
+                        shelly_control.initialize_settings(shelly_settings)
 
             except RuntimeError as e:
                 print(f"Error reloading configuration: {e}", file=sys.stderr)
@@ -264,13 +289,13 @@ def test_shelly_loop(config: SCConfigManager, logger: SCLogger):
                 print(f"Configuration file changed, reloaded config. Logging level = {logger.file_verbosity}")
                 last_check = DateHelper.now()
 
-        wake_event.wait(timeout=loop_delay)
+        next_tick += loop_delay
+        wake_event.wait(timeout=max(0.0, next_tick - time.monotonic()))
         if wake_event.is_set():
-            # We were woken by a webhook call
-            event = shelly_control.pull_webhook_event()
-            if event:
-                print(f"Processing webhook event: {event.get('Event')}")
+            # We were woken by a webhook call. Clear the event first so that anything arriving while we drain the queue wakes us again
             wake_event.clear()
+            while (event := shelly_control.pull_webhook_event()) is not None:
+                print(f"Processing webhook event: {event.get('Event')}")
         loop_count += 1
 
     # Shut down the Shelly control to clean up resources
@@ -281,6 +306,11 @@ def main():
     """Main function to run the example code."""
     print(f"Hello from sc-utility running on {platform.system()}")
 
+    # Start the internet connection check now so that it overlaps with the config and logger setup
+    executor = ThreadPoolExecutor(max_workers=1)
+    internet_check = executor.submit(SCCommon.check_internet_connection)
+    executor.shutdown(wait=False)   # The submitted check still runs to completion
+
     # Get our default schema, validation schema, and placeholders
     schemas = ConfigSchema()
 
@@ -305,7 +335,7 @@ def main():
         return
 
     # Test internet connection
-    if not SCCommon.check_internet_connection():
+    if not internet_check.result():
         logger.log_message("No internet connection detected.", "summary")
 
     # test_spello_control(config, logger)
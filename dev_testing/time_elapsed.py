@@ -1,7 +1,11 @@
 """Calculate seconds elapsed since January 1st, 2025."""
 
+import time
 from datetime import UTC, datetime
 
+# Unix timestamp of the reference date, computed once at import
+JAN_1_2025_TS = datetime(2025, 1, 1, 0, 0, 0, tzinfo=UTC).timestamp()
+
 
 def seconds_since_jan_1_2025() -> float:
     """Return the number of seconds that have elapsed since January 1st, 2025 00:00:00 UTC.
@@ -9,10 +13,7 @@ def seconds_since_jan_1_2025() -> float:
     Returns:
         float: Seconds elapsed since Jan 1, 2025 (can be negative if before that date)
     """
-    jan_1_2025 = datetime(2025, 1, 1, 0, 0, 0, tzinfo=UTC)
-    now = datetime.now(UTC)
-    delta = now - jan_1_2025
-    return delta.total_seconds()
+    return time.time() - JAN_1_2025_TS
 
 
 def main():
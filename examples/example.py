@@ -2,7 +2,6 @@
 
 import datetime as dt
 import platform
-import pprint
 import sys
 
 from example_config_schemas import ConfigSchema
@@ -122,7 +121,8 @@ def main():
         sys.exit(1)
     else:
         print("Table data extracted successfully:\n")
-        pprint.pprint(table_data)
+        for row in table_data:
+            print(row)
 
     # Update a CSV file
     update_csv()
@@ -2,18 +2,71 @@
 sc_utility package.
 
 This package provides utility functions and classes for the SC project.
+
+The public classes are imported on first use, so an app only pays the import cost (openpyxl, pyowm, requests, etc.)
+for the parts of the package it actually uses.
 """
-from weather_client import WeatherClient
-
-from .sc_common import SCCommon
-from .sc_config_mgr import SCConfigManager
-from .sc_csv_reader import CSVReader
-from .sc_date_helper import DateHelper
-from .sc_excel_reader import ExcelReader
-from .sc_json_encoder import JSONEncoder
-from .sc_logging import SCLogger
-from .sc_shelly_control import ShellyControl
-from .validation_schema import yaml_config_validation
-from .webhook_server import _ShellyWebhookHandler
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from weather_client import WeatherClient
+
+    from .sc_common import SCCommon
+    from .sc_config_mgr import SCConfigManager
+    from .sc_csv_reader import CSVReader
+    from .sc_date_helper import DateHelper
+    from .sc_excel_reader import ExcelReader
+    from .sc_json_encoder import JSONEncoder
+    from .sc_logging import SCLogger
+    from .sc_shelly_control import ShellyControl
+    from .validation_schema import yaml_config_validation
+    from .webhook_server import _ShellyWebhookHandler
+
+# Maps each public name to the module that defines it
+_LAZY_IMPORTS = {
+    "CSVReader": ".sc_csv_reader",
+    "DateHelper": ".sc_date_helper",
+    "ExcelReader": ".sc_excel_reader",
+    "JSONEncoder": ".sc_json_encoder",
+    "SCCommon": ".sc_common",
+    "SCConfigManager": ".sc_config_mgr",
+    "SCLogger": ".sc_logging",
+    "ShellyControl": ".sc_shelly_control",
+    "WeatherClient": "weather_client",
+    "_ShellyWebhookHandler": ".webhook_server",
+    "yaml_config_validation": ".validation_schema",
+}
 
 __all__ = ["CSVReader", "DateHelper", "ExcelReader", "JSONEncoder", "SCCommon", "SCConfigManager", "SCLogger", "ShellyControl", "WeatherClient", "_ShellyWebhookHandler", "yaml_config_validation"]
+
+
+def __getattr__(name: str) -> object:
+    """Import a public class from its module the first time it's accessed.
+
+    Args:
+        name (str): The attribute being looked up.
+
+    Raises:
+        AttributeError: If name isn't one of the package's public names.
+
+    Returns:
+        value (object): The requested class or object.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        error_msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(error_msg)
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache it so __getattr__ isn't called again for this name
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package's attributes, including the public names that haven't been imported yet.
+
+    Returns:
+        names (list[str]): The sorted attribute names.
+    """
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,6 @@
 """Common utility functions and classes used by other classes in the sc_utility package."""
 
+import functools
 import ipaddress
 import os
 import platform
@@ -7,7 +8,6 @@ import re
 import subprocess  # noqa: S404
 from pathlib import Path
 
-import httpx
 import validators
 
 
@@ -122,6 +122,9 @@ class SCCommon:
                 "https://www.cloudflare.com"
             ]
 
+        # httpx is slow to import and only needed here, so don't make every user of sc_common (DateHelper etc.) pay for it
+        import httpx  # noqa: PLC0415
+
         for url in urls:
             try:
                 response = httpx.get(url, timeout=timeout, follow_redirects=True)
@@ -214,6 +217,29 @@ class SCCommon:
             return path
 
         # Default behaviour is to look for the project root based on the location of this file and the presence of marker files. This allows the utility to be used in other projects without requiring users
+        root_dir = SCCommon._find_marker_root(tuple(marker_files))
+        if root_dir is not None:
+            return root_dir
+
+        error_msg = f"Project root not found. Looked for markers: {marker_files}"
+        if env_path:
+            error_msg += f" (also checked SC_UTILITY_PROJECT_ROOT={env_path})"
+        raise RuntimeError(error_msg)
+
+    @staticmethod
+    @functools.cache
+    def _find_marker_root(marker_files: tuple) -> Path | None:
+        """Walk upwards from the location of this file until we find a folder containing one of the marker files.
+
+        The location of this file doesn't change while the app is running, so the result is cached for each set of
+        markers. This saves a resolve() and a stat() per folder and marker on every call to get_project_root().
+
+        Args:
+            marker_files (tuple): A tuple of file names that indicate the project root.
+
+        Returns:
+            root_dir (Path | None): The first folder found containing a marker file, or None if there isn't one.
+        """
         path = Path(__file__).resolve()
 
         # Walk upwards until we find a marker file
@@ -221,11 +247,7 @@ class SCCommon:
             for marker in marker_files:
                 if (parent / marker).exists():
                     return parent
-
-        error_msg = f"Project root not found. Looked for markers: {marker_files}"
-        if env_path:
-            error_msg += f" (also checked SC_UTILITY_PROJECT_ROOT={env_path})"
-        raise RuntimeError(error_msg)
+        return None
 
     @staticmethod
     def select_file_location(file_name: str, create_folder: bool = False) -> Path | None:
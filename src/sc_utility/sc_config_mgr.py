@@ -2,40 +2,65 @@
 
 Management of a YAML log file.
 """
+from __future__ import annotations
+
+import copy
 import datetime as dt
+import hashlib
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import yaml
-from cerberus import Validator
 from mergedeep import merge
 
 from sc_utility.sc_common import SCCommon
 from sc_utility.sc_date_helper import DateHelper
 from sc_utility.validation_schema import yaml_config_validation
 
+if TYPE_CHECKING:
+    from cerberus import Validator
+
+# Use the libyaml C parser and emitter when PyYAML has been built with them, they're much faster than the pure Python versions
+try:
+    from yaml import CDumper as _YAMLDumper, CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import Dumper as _YAMLDumper, SafeLoader as _YAMLLoader
+
+_MISSING = object()  # Sentinel for key paths that aren't in the config
+
+# Parsed config files, keyed on the file path. Each entry is ((st_mtime_ns, st_size), content_digest, parsed_yaml)
+_PARSE_CACHE: dict[str, tuple[tuple[int, int], bytes, dict]] = {}
+
 
 class SCConfigManager:
     """Loads the configuration from a YAML file, validates it, and provides access to the configuration values."""
 
-    def __init__(self, config_file: str, default_config: dict | None = None, validation_schema: dict | None = None, placeholders: dict | None = None):
+    def __init__(self, config_file: str, default_config: Mapping | None = None, validation_schema: Mapping | None = None, placeholders: Mapping | None = None, skip_validation: bool = False, lazy_load: bool = False):
         """Initializes the configuration manager.
 
         Args:
             config_file (str): The relative or absolute path to the configuration file.
-            default_config (Optional[dict], optional): A default configuration dict to use if the config file does not exist.
-            validation_schema (Optional[dict], optional): A cerberus style validation schema dict to validate the config file against.
-            placeholders (Optional[dict], optional): A dictionary of placeholders to check in the config. If any of these are found, a exception will be raised.
+            default_config (Optional[Mapping], optional): A default configuration dict to use if the config file does not exist. May be a read-only mapping; it is never modified.
+            validation_schema (Optional[Mapping], optional): A cerberus style validation schema dict to validate the config file against. May be a read-only mapping; it is never modified.
+            placeholders (Optional[Mapping], optional): A dictionary of placeholders to check in the config. If any of these are found, a exception will be raised.
+            skip_validation (bool, optional): If True, don't validate the config file against the validation schema. Use this to save start up time in trusted
+                environments where the config file is known to be good. Placeholder checks and the defaults applied by the get_*() functions are unaffected.
+            lazy_load (bool, optional): If True, don't load the config file until a value is first read from it. Any YAML, placeholder or validation errors
+                are then raised by that first read instead of by this constructor.
 
         Raises:
             RuntimeError: If the config file does not exist and no default config is provided, or if there are YAML errors in the config file.
 
         """
         self._config = {}    # Intialise the actual config object
+        self._logger_settings_cache: dict[str | None, dict] = {}  # get_logger_settings() results, keyed on config section. Cleared whenever the config is reloaded
         self.config_file = config_file
         self.logger_function = None  # Placeholder for a logger function
         self.placeholders = placeholders
+        self.skip_validation = skip_validation
+        self._placeholder_paths = self._flatten_placeholders(placeholders) if placeholders is not None else []
 
         # Build the full validation schema
         if validation_schema is None:
@@ -43,11 +68,26 @@ class SCConfigManager:
         else:
             self.validation_schema = merge({}, yaml_config_validation, validation_schema)
 
+        # Compiled validators, keyed on the set of top level sections they cover
+        self._validators: dict[frozenset, Validator] = {}
+
+        # (st_mtime_ns, st_size) of the file version currently loaded into self._config
+        self._loaded_stamp: tuple[int, int] | None = None
+        self._loaded_digest: bytes | None = None    # blake2b digest of that version's contents
+
+        # Last seen modification time of the config file, so check_for_config_changes() only converts it when it changes
+        self._last_mtime_ns: int | None = None
+        self._last_modified_dt: dt.datetime | None = None
+
+        # Top level sections that differ between the last two successful loads
+        self._changed_sections: set[str] = set()
+
         # Determine the file path for the log file
         self.config_path = SCCommon.select_file_location(self.config_file)
         if self.config_path is None:
             msg = f"Cannot find config file {self.config_file}. Please check the path."
             raise RuntimeError(msg)
+        self._config_path_str = os.fspath(self.config_path)  # For os.stat(), which skips the pathlib overhead on the polling path
 
         # If the config file doesn't exist and we have a default config, write that to file
         if not self.config_path.exists():
@@ -56,14 +96,27 @@ class SCConfigManager:
                 raise RuntimeError(msg)
 
             with Path(self.config_path).open("w", encoding="utf-8") as file:
-                yaml.dump(default_config, file)
-
-        # Now load the config file
-        self.load_config()
+                # yaml can't represent a read-only mapping, so dump a plain dict
+                yaml.dump(dict(default_config), file, Dumper=_YAMLDumper)
+
+            # The default config will usually still contain placeholders, so report those now rather than parsing and validating the file we just wrote
+            if self._placeholder_paths and not lazy_load:
+                self._config = default_config  # type: ignore[assignment]
+                try:
+                    self.check_for_placeholders(self.placeholders)
+                finally:
+                    self._config = {}
+
+        # Now load the config file, unless the caller wants to wait until it's first used
+        if not lazy_load:
+            self.load_config()
 
-    def load_config(self) -> bool:
+    def load_config(self, stat_result: os.stat_result | None = None) -> bool:
         """Load the configuration from the config file specified to the __init__ method.
 
+        Args:
+            stat_result (os.stat_result | None, optional): A stat() result for the config file that the caller has just taken. If not provided, the file is stat'ed here.
+
         Raises:
             RuntimeError: If there are YAML errors in the config file, if placeholders are found, or if validation fails.
 
@@ -73,31 +126,80 @@ class SCConfigManager:
         if not self.config_path:
             return False
 
-        with Path(self.config_path).open(encoding="utf-8") as file:
-            try:
-                self._config = yaml.safe_load(file)
+        # Reuse the parsed YAML if this file hasn't changed since it was last parsed (by this or any other instance)
+        file_stat = stat_result if stat_result is not None else os.stat(self._config_path_str)  # noqa: PTH116
+        file_stamp = (file_stat.st_mtime_ns, file_stat.st_size)
+        cache_key = self._config_path_str
+        cached = _PARSE_CACHE.get(cache_key)
+        if cached is not None and cached[0] == file_stamp:
+            _, file_digest, parsed_config = cached
+        else:
+            # The file has been written to, but may just have been touched or saved without changes, so compare the contents
+            file_bytes = Path(self.config_path).read_bytes()
+            file_digest = hashlib.blake2b(file_bytes, digest_size=16).digest()
+            if cached is not None and cached[1] == file_digest:
+                parsed_config = cached[2]
+            else:
+                # Let PyYAML decode the bytes itself, it handles the UTF-8 decoding and line break normalisation
+                try:
+                    parsed_config = yaml.load(file_bytes, Loader=_YAMLLoader)  # noqa: S506
+                except yaml.YAMLError as e:
+                    msg = f"YAML error in config file {self.config_file}: {e}"
+                    raise RuntimeError(msg) from e
+            _PARSE_CACHE[cache_key] = (file_stamp, file_digest, parsed_config)
+
+        # Give this instance its own copy so callers can't change the cached version
+        previous_config = self._config if isinstance(self._config, dict) else {}
+        self._config = copy.deepcopy(parsed_config)
+        self._logger_settings_cache.clear()
+
+        # These exact file contents have already passed the placeholder and validation checks, so there's no need to repeat them
+        already_checked = file_digest == self._loaded_digest
+
+        # Make sure there are no placeholders in the config file, exit if there are
+        if not already_checked:
+            self.check_for_placeholders(self.placeholders)
+
+        # If we have a validation schema, validate the config
+        if self.validation_schema is not None and not self.skip_validation and not already_checked:
+            v = self._get_validator()
+
+            if not v.validate(self._config):  # type: ignore[call-arg]
+                # Format cerberus errors into human readable lines like "path.to.field: error message"
+
+                error_lines = self._format_validator_errors(v.errors)  # type: ignore[call-arg]
+                nice = "\n".join(error_lines)
+                msg = f"Validation error for config file {self.config_path}: \n{nice}"
+                raise RuntimeError(msg)
 
-            except yaml.YAMLError as e:
-                msg = f"YAML error in config file {self.config_file}: {e}"
-                raise RuntimeError(msg) from e
+        new_config = self._config if isinstance(self._config, dict) else {}
+        self._changed_sections = {key for key in new_config.keys() | previous_config.keys()
+                                  if new_config.get(key) != previous_config.get(key)}
+        self._loaded_stamp = file_stamp
+        self._loaded_digest = file_digest
+        return True
 
-            else:
-                # Make sure there are no placeholders in the config file, exit if there are
-                self.check_for_placeholders(self.placeholders)
+    def _get_validator(self) -> Validator:
+        """Return a compiled validator covering only the schema sections that apply to the loaded config.
 
-                # If we have a validation schema, validate the config
-                if self.validation_schema is not None:
-                    v = Validator()
+        Sections that are absent from the config file and not marked as required are left out, so we don't pay to
+        compile (and walk) rules for features the app doesn't use. Validators are cached per section set.
 
-                    if not v.validate(self._config, self.validation_schema):  # type: ignore[call-arg]
-                        # Format cerberus errors into human readable lines like "path.to.field: error message"
+        Returns:
+            validator (Validator): The cerberus validator to use.
+        """
+        config_keys = self._config.keys() if isinstance(self._config, dict) else ()
+        sections = frozenset(key for key, rules in self.validation_schema.items()
+                             if key in config_keys or (isinstance(rules, dict) and rules.get("required")))
 
-                        error_lines = self._format_validator_errors(v.errors)  # type: ignore[call-arg]
-                        nice = "\n".join(error_lines)
-                        msg = f"Validation error for config file {self.config_path}: \n{nice}"
-                        raise RuntimeError(msg)
+        validator = self._validators.get(sections)
+        if validator is None:
+            # Only import cerberus once something actually needs validating, it's slow to import
+            from cerberus import Validator  # noqa: PLC0415
 
-        return True
+            validator = Validator({key: self.validation_schema[key] for key in sections})
+            self._validators[sections] = validator
+        return validator
 
     @staticmethod
     def _format_validator_errors(err, path=""):
@@ -151,17 +253,39 @@ class SCConfigManager:
         Returns:
             result (dt.datetime | None): The new last modified time if the config has changed and was reloaded, None otherwise.
         """
-        last_modified_dt = self.get_config_file_last_modified()
-        if last_modified_dt is None:
+        if not self.config_path:
             return None
 
-        if last_check is None or last_modified_dt > last_check:
-            # The config file has changed, reload it
-            self.load_config()
+        # This is called on every pass of the app's main loop, so make do with a single stat() call when nothing has changed
+        try:
+            file_stat = os.stat(self._config_path_str)  # noqa: PTH116
+        except FileNotFoundError:
+            return None
+
+        if file_stat.st_mtime_ns != self._last_mtime_ns:
+            self._last_mtime_ns = file_stat.st_mtime_ns
+            self._last_modified_dt = dt.datetime.fromtimestamp(file_stat.st_mtime, tz=DateHelper.get_local_timezone())
+        last_modified_dt = self._last_modified_dt
+
+        if last_check is None or last_modified_dt > last_check:  # type: ignore[operator]
+            # The config file has changed, reload it unless that version is already loaded
+            if (file_stat.st_mtime_ns, file_stat.st_size) != self._loaded_stamp:
+                self.load_config(stat_result=file_stat)
             return last_modified_dt
 
         return None
 
+    def get_changed_sections(self) -> set[str]:
+        """Returns the top level config sections that changed when the config was last (re)loaded.
+
+        Use this after check_for_config_changes() reports a change to only re-apply the settings that actually changed.
+        After the initial load, every section in the config file is reported as changed.
+
+        Returns:
+            result (set[str]): The names of the sections that were added, removed or modified.
+        """
+        return set(self._changed_sections)
+
     def register_logger(self, logger_function: Callable) -> None:
         """Registers a logger function to be used for logging messages.
 
@@ -170,13 +294,13 @@ class SCConfigManager:
         """
         self.logger_function = logger_function
 
-    def check_for_placeholders(self, placeholders: dict | None) -> bool:
-        """Recursively scan self._config for any instances of a key found in placeholders.
+    def check_for_placeholders(self, placeholders: Mapping | None) -> bool:
+        """Scan self._config for any instances of a key found in placeholders.
 
         If the keys and values match (including nested), return True.
 
         Args:
-            placeholders (dict): A dictionary of placeholders to check in the config.
+            placeholders (Mapping): A dictionary of placeholders to check in the config.
 
         Raises:
             RuntimeError: If any placeholder is found in the config file, an exception will be raised with a message indicating the placeholder and its value.
@@ -184,22 +308,50 @@ class SCConfigManager:
         Returns:
             result (bool): True if any placeholders are found in the config, otherwise False.
         """  # noqa: DOC502
-        def recursive_check(config_section, placeholder_section):
-            for key, placeholder_value in placeholder_section.items():
-                if key and key in config_section:
-                    config_value = config_section[key]
-                    if isinstance(placeholder_value, dict) and isinstance(config_value, dict):
-                        if recursive_check(config_value, placeholder_value):
-                            return True
-                    elif config_value == placeholder_value:
-                        msg = f"Placeholder value '{key}: {placeholder_value}' found in config file {self.config_path}. Please fix this."
-                        raise RuntimeError(msg)
-            return False
-
         if placeholders is None:
             return False
 
-        return recursive_check(self._config, placeholders)
+        # The placeholders passed to __init__ were flattened once up front
+        placeholder_paths = self._placeholder_paths if placeholders is self.placeholders else self._flatten_placeholders(placeholders)
+
+        for key_path, placeholder_value in placeholder_paths:
+            config_value = self._config
+            for depth, key in enumerate(key_path):
+                # Only descend into nested sections that are dicts in the config too
+                if (depth and not isinstance(config_value, dict)) or not key or key not in config_value:
+                    break
+                config_value = config_value[key]
+            else:
+                if config_value == placeholder_value:
+                    msg = f"Placeholder value '{key_path[-1]}: {placeholder_value}' found in config file {self.config_path}. Please fix this."
+                    raise RuntimeError(msg)
+        return False
+
+    @staticmethod
+    def _flatten_placeholders(placeholders: Mapping) -> list[tuple[tuple, object]]:
+        """Flatten a nested placeholders dict into a list of (key path, placeholder value) pairs, in depth first order.
+
+        Args:
+            placeholders (Mapping): A dictionary of placeholders, as passed to check_for_placeholders().
+
+        Returns:
+            result (list[tuple[tuple, object]]): One entry for each non-dict placeholder value.
+        """
+        placeholder_paths = []
+
+        # Walk the nested sections with an explicit stack of iterators rather than recursing, keeping the depth first order
+        stack = [((), iter(placeholders.items()))]
+        while stack:
+            key_path, section_items = stack[-1]
+            for key, placeholder_value in section_items:
+                if isinstance(placeholder_value, dict):
+                    stack.append(((*key_path, key), iter(placeholder_value.items())))
+                    break
+                placeholder_paths.append(((*key_path, key), placeholder_value))
+            else:
+                stack.pop()
+
+        return placeholder_paths
 
     def get(self, *keys, default=None):
         """Retrieve a value from the config dictionary using a sequence of nested keys.
@@ -211,18 +363,59 @@ class SCConfigManager:
             keys (*keys): Sequence of keys to traverse the config dictionary.
             default (Optional[variable], optional): Value to return if the key path does not exist.
 
+        Raises:
+            RuntimeError: If the config manager was created with lazy_load and the config file fails to load.
+
         Returns:
             value (variable): The value if found, otherwise the default.
 
+        """  # noqa: DOC502
+        # Config managers created with lazy_load only read the file on first use
+        if self._loaded_stamp is None:
+            self.load_config()
+
+        # No caching here: get() hands back the live section dicts, and callers may change them
+        value = self._lookup(keys)
+        return default if value is _MISSING else value
+
+    def _lookup(self, keys: tuple) -> object:
+        """Walk the config dictionary using a sequence of nested keys.
+
+        Args:
+            keys (tuple): Sequence of keys to traverse the config dictionary.
+
+        Returns:
+            value (object): The value if found, otherwise the _MISSING sentinel.
         """
+        # Missing keys are common for optional settings, so look them up without raising and catching exceptions
         value = self._config
-        try:
-            for key in keys:
-                value = value[key]
-        except (KeyError, TypeError):
-            return default
-        else:
-            return value
+        for key in keys:
+            if isinstance(value, dict):
+                try:
+                    value = value.get(key, _MISSING)
+                except TypeError:
+                    return _MISSING  # Unhashable key, e.g. a list
+                if value is _MISSING:
+                    return _MISSING
+            else:
+                # Not a section, but it might still be indexable (e.g. a list of devices)
+                try:
+                    value = value[key]
+                except (KeyError, TypeError):
+                    return _MISSING
+        return value
+
+    def _get_section(self, config_section: str | None) -> dict:
+        """Returns a top level section of the config, so that the settings getters only look it up once.
+
+        Args:
+            config_section (Optional[str]): The section to return.
+
+        Returns:
+            section (dict): The section, or an empty dict if it's missing or isn't a dict.
+        """
+        section = self.get(config_section)
+        return section if isinstance(section, dict) else {}
 
     def get_logger_settings(self, config_section: str | None = "Files") -> dict:
         """Returns the logger settings from the config file.
@@ -233,16 +426,20 @@ class SCConfigManager:
         Returns:
             settings (dict): A dictionary of logger settings that can be passed to the SCLogger() class initialization.
         """
-        logger_settings = {
-            "logfile_name": self.get(config_section, "LogfileName"),
-            "file_verbosity": self.get(config_section, "LogfileVerbosity", default="summary"),
-            "console_verbosity": self.get(config_section, "ConsoleVerbosity", default="summary"),
-            "max_lines": self.get(config_section, "LogfileMaxLines", default=10000),
-            "timestamp_format": self.get(config_section, "TimestampFormat", default="%Y-%m-%d %H:%M:%S"),
-            "log_process_id": self.get(config_section, "LogProcessID", default=False),
-            "log_thread_id": self.get(config_section, "LogThreadID", default=False),
-        }
-        return logger_settings
+        # Build the settings once per loaded config, but hand out a copy so callers can't change the cached version
+        logger_settings = self._logger_settings_cache.get(config_section)
+        if logger_settings is None:
+            section = self._get_section(config_section)
+            logger_settings = self._logger_settings_cache[config_section] = {
+                "logfile_name": section.get("LogfileName"),
+                "file_verbosity": section.get("LogfileVerbosity", "summary"),
+                "console_verbosity": section.get("ConsoleVerbosity", "summary"),
+                "max_lines": section.get("LogfileMaxLines", 10000),
+                "timestamp_format": section.get("TimestampFormat", "%Y-%m-%d %H:%M:%S"),
+                "log_process_id": section.get("LogProcessID", False),
+                "log_thread_id": section.get("LogThreadID", False),
+            }
+        return dict(logger_settings)
 
     def get_email_settings(self, config_section: str | None = "Email") -> dict | None:
         """Returns the email settings from the config file.
@@ -253,23 +450,25 @@ class SCConfigManager:
         Returns:
             settings (dict): A dictionary of email settings or None if email is disabled or not configured correctly.
         """
+        section = self._get_section(config_section)
+
         # fir check to see if we have an EnableEmail setting
-        enable_email = self.get(config_section, "EnableEmail", default=True)
+        enable_email = section.get("EnableEmail", True)
         if not enable_email:
             return None
         smtp_username = os.environ.get("SMTP_USERNAME")
         if not smtp_username:
-            smtp_username = self.get(config_section, "SMTPUsername")
+            smtp_username = section.get("SMTPUsername")
         smtp_password = os.environ.get("SMTP_PASSWORD")
         if not smtp_password:
-            smtp_password = self.get(config_section, "SMTPPassword")
+            smtp_password = section.get("SMTPPassword")
 
         email_settings = {
-            "SendEmailsTo": self.get(config_section, "SendEmailsTo"),
-            "SMTPServer": self.get(config_section, "SMTPServer"),
+            "SendEmailsTo": section.get("SendEmailsTo"),
+            "SMTPServer": section.get("SMTPServer"),
             "SMTPUsername": smtp_username,
             "SMTPPassword": smtp_password,
-            "SubjectPrefix": self.get(config_section, "SubjectPrefix"),
+            "SubjectPrefix": section.get("SubjectPrefix"),
         }
 
         # Only return true if all the required email settings have been specified (excluding SubjectPrefix)
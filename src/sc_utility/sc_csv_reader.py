@@ -2,13 +2,19 @@
 import csv
 import datetime as dt
 import operator
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 from sc_utility.sc_date_helper import DateHelper
 
 
 class CSVReader:
     """Class for reading and writing CSV files with header configuration."""
+    _DEFAULT_READ_FORMATS = {"date": "%Y-%m-%d", "datetime": "%Y-%m-%d %H:%M:%S", "time": "%H:%M:%S"}
+    _DEFAULT_WRITE_FORMATS = {"date": "%Y-%m-%d", "datetime": "%Y-%m-%d %H:%M:%S", "time": "%H:%M"}
+    _DATE_TYPE_CLASSES = {"date": dt.date, "datetime": dt.datetime, "time": dt.time}
+
     def __init__(self, file_path: Path | str, header_config: list[dict] | None = None):
         """Initialize the CSVReader with the file path.
 
@@ -101,7 +107,7 @@ class CSVReader:
 
         return ""
 
-    def read_csv(self) -> list[dict] | None:  # noqa: PLR0912
+    def read_csv(self) -> list[dict] | None:
         """Read the CSV file and return its content.
 
         If the file does not exist, return None. If the file has a header but no data, returns an empty list.
@@ -155,41 +161,19 @@ class CSVReader:
             if file_headers is not None:
                 self.header_config.sort(key=lambda x: file_headers.index(x["name"]))  # type: ignore[call-arg]
 
+            # Resolve the type conversion for each column once, rather than re-checking the header config for every cell
+            converters = [self._get_value_parser(config) for config in self.header_config]
+            converter_count = len(converters)
+
             # Read the data rows from the CSV file
             for row in reader:
                 if row:
                     # Convert the row to a dictionary using the self.header_config to convert the data types
                     row_dict = {}
                     for i, header in enumerate(file_headers):
-                        if i < len(self.header_config):
+                        if i < converter_count:
                             try:
-                                config = self.header_config[i]
-                                if config["type"] == "date":
-                                    # Convert date strings to time objects
-                                    date_format = config.get("format", "%Y-%m-%d")
-                                    row_dict[header] = DateHelper.extract(row[i], date_format)
-                                elif config["type"] == "datetime":
-                                    # Convert datetime strings to datetime objects
-                                    datetime_format = config.get("format", "%Y-%m-%d %H:%M:%S")
-                                    row_dict[header] = DateHelper.extract(row[i], datetime_format)
-                                elif config["type"] == "time":
-                                    # Convert time strings to time objects
-                                    time_format = config.get("format", "%H:%M:%S")
-                                    row_dict[header] = DateHelper.extract(row[i], time_format)
-                                elif config["type"] == "float":
-                                    # Convert float strings to float and round if specified
-                                    row_dict[header] = float(row[i])
-                                    if "format" in config:
-                                        row_dict[header] = float(format(row_dict[header], config["format"]))
-                                elif config["type"] == "int":
-                                    # Convert Int strings to int
-                                    row_dict[header] = int(row[i])
-                                elif config["type"] == "bool":
-                                    # Convert Boolean strings to bool
-                                    row_dict[header] = row[i].lower() in {"true", "1", "yes"}
-                                else:
-                                    # Default to string type
-                                    row_dict[header] = row[i]
+                                row_dict[header] = converters[i](row[i])
                             except (ValueError, TypeError) as e:
                                 error_msg = (
                                     f"Value '{row[i]}' in row {reader.line_num} cannot be converted to the expected type "
@@ -204,6 +188,56 @@ class CSVReader:
 
             return csv_data
 
+    @staticmethod
+    def _get_value_parser(config: dict) -> Callable[[str], Any]:
+        """Return a function that converts a raw CSV string into the type defined by a header config entry.
+
+        Args:
+            config (dict): The header configuration for the column.
+
+        Returns:
+            parser (Callable): A function taking the CSV string and returning the converted value.
+        """
+        field_type = config["type"]
+        if field_type in {"date", "datetime", "time"}:
+            # Convert date, datetime and time strings to the relevant objects
+            dt_format = config.get("format", CSVReader._DEFAULT_READ_FORMATS[field_type])
+            return lambda value: DateHelper.extract(value, dt_format)
+        if field_type == "float":
+            # Convert float strings to float and round if specified
+            if "format" in config:
+                float_format = config["format"]
+                return lambda value: float(format(float(value), float_format))
+            return float
+        if field_type == "int":
+            # Convert Int strings to int
+            return int
+        if field_type == "bool":
+            # Convert Boolean strings to bool
+            return lambda value: value.lower() in {"true", "1", "yes"}
+        # Default to string type
+        return str
+
+    @staticmethod
+    def _get_value_formatter(header: dict) -> Callable[[Any], Any]:
+        """Return a function that formats a value for writing to the CSV file, based on a header config entry.
+
+        Args:
+            header (dict): The header configuration for the column.
+
+        Returns:
+            formatter (Callable): A function taking the data value and returning the value to write.
+        """
+        field_type = header["type"]
+        if field_type in {"date", "datetime", "time"}:
+            dt_format = header.get("format", CSVReader._DEFAULT_WRITE_FORMATS[field_type])
+            dt_class = CSVReader._DATE_TYPE_CLASSES[field_type]
+            return lambda value: value.strftime(dt_format) if isinstance(value, dt_class) else value
+        if field_type == "float" and "format" in header:
+            float_format = header["format"]
+            return lambda value: format(value, float_format)
+        return lambda value: value
+
     def sort_csv_data(self, csv_data: list[dict]) -> list[dict]:
         """Sort the CSV data based on the header configuration.
 
@@ -318,6 +352,14 @@ class CSVReader:
         if not minimum_headers and max_lines is None:
             return csv_data
 
+        # If max_days is set it applies to every date/datetime header, so work out the cutoffs just once
+        max_days_cutoffs = {}
+        if max_days is not None:
+            max_days_cutoffs = {
+                "date": DateHelper.today_add_days(-max_days),
+                "datetime": DateHelper.add(DateHelper.now(), days=-max_days),  # Timezone left in place - Issue 33
+            }
+
         # Trim based on header configuration
         trimmed_data = csv_data
         for header in minimum_headers:
@@ -327,12 +369,8 @@ class CSVReader:
 
             # Calculate the cutoff date
             if max_days is not None:
-                if field_type == "date":
-                    cutoff = DateHelper.today_add_days(-max_days)
-                elif field_type == "datetime":
-                    cutoff = DateHelper.add(DateHelper.now(), days=-max_days)
-                    # cutoff = DateHelper.remove_timezone(cutoff)  # Issue 33
-                else:
+                cutoff = max_days_cutoffs.get(field_type)
+                if cutoff is None:
                     continue  # Skip if field type is not date or datetime
             elif isinstance(minimum_value, (dt.date, dt.datetime)):
                 cutoff = minimum_value
@@ -347,10 +385,10 @@ class CSVReader:
             else:
                 continue  # Skip if minimum is neither date nor int
 
-            # Filter out records with dates prior to cutoff_date
+            # Filter out records with dates prior to cutoff_date (a datetime is also a date)
             trimmed_data = [
                 row for row in trimmed_data
-                if field_name in row and isinstance(row[field_name], (dt.date, dt.datetime)) and row[field_name] >= cutoff
+                if isinstance(value := row.get(field_name), dt.date) and value >= cutoff
             ]
 
         # If max_lines is specified, trim the data to that many lines
@@ -362,7 +400,7 @@ class CSVReader:
 
         return trimmed_data
 
-    def write_csv(self, data: list[dict], new_filename: Path | str | None = None) -> bool:  # noqa: PLR0912
+    def write_csv(self, data: list[dict], new_filename: Path | str | None = None) -> bool:
         """Write data to the CSV file.
 
         1. If the file does not exist, it will be created.
@@ -413,43 +451,27 @@ class CSVReader:
                 raise ValueError(error_msg)
 
         # Format the data according to header_config
-        formatted_data = []
-        for row in data:
-            formatted_row = {}
-            for header in self.header_config:
-                field_name = header["name"]
-                value = row[field_name]
-
-                # Format according to header config
-                if header["type"] == "date" and isinstance(value, dt.date):
-                    date_format = header.get("format", "%Y-%m-%d")
-                    formatted_row[field_name] = value.strftime(date_format)
-                elif header["type"] == "datetime" and isinstance(value, dt.datetime):
-                    datetime_format = header.get("format", "%Y-%m-%d %H:%M:%S")
-                    formatted_row[field_name] = value.strftime(datetime_format)
-                elif header["type"] == "time" and isinstance(value, dt.time):
-                    time_format = header.get("format", "%H:%M")
-                    formatted_row[field_name] = value.strftime(time_format)
-                elif header["type"] == "float" and "format" in header:
-                    formatted_row[field_name] = format(value, header["format"])
-                else:
-                    formatted_row[field_name] = value
-
-            formatted_data.append(formatted_row)
+        field_names = [header["name"] for header in self.header_config]
+        formatters = [self._get_value_formatter(header) for header in self.header_config]
+        columns = list(zip(field_names, formatters, strict=True))
+        formatted_data = [
+            {field_name: formatter(row[field_name]) for field_name, formatter in columns}
+            for row in data
+        ]
 
         # Write the CSV file
         if use_temp_file:
             temporary_path = self.file_path.with_suffix(".tmp")
 
             with temporary_path.open("w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=[header["name"] for header in self.header_config])
+                writer = csv.DictWriter(csvfile, fieldnames=field_names)
                 writer.writeheader()
                 writer.writerows(formatted_data)
             # Replace the original file with the temporary file
             temporary_path.replace(self.file_path)
         else:
             with self.file_path.open("w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=[header["name"] for header in self.header_config])
+                writer = csv.DictWriter(csvfile, fieldnames=field_names)
                 writer.writeheader()
                 writer.writerows(formatted_data)
 
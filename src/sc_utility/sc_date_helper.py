@@ -2,13 +2,61 @@
 
 import contextlib
 import datetime as dt
+import functools
 import json
+import os
+import re
+from collections.abc import Iterable
 from pathlib import Path
 from warnings import deprecated
 
 from sc_utility.sc_common import SCCommon
 
-_LOCAL_TZ = dt.datetime.now().astimezone().tzinfo
+# The local timezone is looked up once at import. Methods in this module use it directly rather than calling
+# get_local_timezone(), as several of them are called for every row when processing files.
+_LOCAL_TZ: dt.tzinfo = dt.datetime.now().astimezone().tzinfo  # pyright: ignore[reportAssignmentType]
+
+# Pre-compiled patterns for the default formats used by the is_valid_*() functions and parse_date(). These mirror the
+# patterns that strptime() builds for the same format strings, and let us validate without going through the strptime
+# machinery. Like strptime's %d, the day may be space padded (e.g. "2025-05- 4"). They only cover ASCII strings,
+# strptime() has its own quirks for other Unicode digits and spaces.
+_FAST_VALIDATORS = {
+    "%Y-%m-%d": (re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2}| \d)", re.ASCII), dt.date),
+    "%Y-%m-%d %H:%M:%S": (re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2}| \d)\s+(\d{1,2}):(\d{1,2}):(\d{1,2})", re.ASCII), dt.datetime),
+    "%H:%M:%S": (re.compile(r"(\d{1,2}):(\d{1,2}):(\d{1,2})", re.ASCII), dt.time),
+}
+
+# Zero padded versions of the default extract() formats. Strings with exactly this shape parse identically with the
+# C implemented fromisoformat(), so extract() can skip the strptime() cascade for them.
+_ISO_SHAPES = (
+    (re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2} [0-9]{2}:[0-9]{2}:[0-9]{2}(?:[+-][0-9]{2}:?[0-9]{2}|Z)?"), dt.datetime),
+    (re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}"), dt.date),
+    (re.compile(r"[0-9]{2}:[0-9]{2}:[0-9]{2}(?:\.[0-9]{1,6})?"), dt.time),
+)
+
+_MAX_DATE_ORDINAL = dt.date.max.toordinal()
+_MIDNIGHT = dt.time(0, 0, 0)
+
+# Every capitalisation of the "ISO" format_str, so that it can be recognised without upper() allocating a new string on every call
+_ISO_FORMAT_STRS = frozenset({"ISO", "ISo", "IsO", "Iso", "iSO", "iSo", "isO", "iso"})
+
+# The default format() format strings for each type
+_DEFAULT_FORMAT_STRS = {
+    dt.datetime: "%Y-%m-%d %H:%M:%S",
+    dt.date: "%Y-%m-%d",
+    dt.time: "%H:%M:%S",
+}
+
+# The strftime() directives that _classify_format_str() uses to tell date, datetime and time format strings apart
+_DATE_FORMAT_TOKENS = re.compile(r"%[YyBmAadj]")
+_TIME_FORMAT_TOKENS = re.compile(r"%[HIpMSfzZ]")
+
+# The default extract() formats for each type, in the order they're tried
+_DEFAULT_FORMATS = (
+    (dt.datetime, ("%Y-%m-%d %H:%M:%S%z", "%Y-%m-%d %H:%M:%S")),
+    (dt.date, ("%Y-%m-%d",)),
+    (dt.time, ("%H:%M:%S.%f", "%H:%M:%S")),
+)
 
 
 class DateHelper:  # noqa: PLR0904
@@ -35,15 +83,12 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (date | datetime): A new date or datetime object with the added timedelta.
         """
-        if dt_obj is None or not isinstance(dt_obj, (dt.date, dt.datetime)):
+        # datetime is a subclass of date, so this covers both
+        if not isinstance(dt_obj, dt.date):
             msg = f"Invalid data type passed DateHelper.add({dt_obj}). Expected a date or datetime object."
             raise TypeError(msg)
 
-        try:
-            return dt_obj + dt.timedelta(**kwargs)
-        except TypeError as e:
-            msg = f"Invalid keyword arguments for timedelta in DateHelper.add(dt_obj={dt_obj}, kwargs={kwargs}): {e}"
-            raise TypeError(msg) from e
+        return DateHelper._add_timedelta(dt_obj, kwargs, "add")  # type: ignore[return-value]
 
     @staticmethod
     def add_date(dt_obj: dt.date, **kwargs) -> dt.date:
@@ -60,15 +105,11 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (date): A new date object with the added timedelta.
         """
-        if dt_obj is None or not isinstance(dt_obj, dt.date):
+        if not isinstance(dt_obj, dt.date):
             msg = f"Invalid data type passed DateHelper.add_date({dt_obj}). Expected a date object."
             raise TypeError(msg)
 
-        try:
-            return dt_obj + dt.timedelta(**kwargs)
-        except TypeError as e:
-            msg = f"Invalid keyword arguments for timedelta in DateHelper.add_date(dt_obj={dt_obj}, kwargs={kwargs}): {e}"
-            raise TypeError(msg) from e
+        return DateHelper._add_timedelta(dt_obj, kwargs, "add_date")  # type: ignore[return-value]
 
     @staticmethod
     def add_datetime(dt_obj: dt.datetime, **kwargs) -> dt.datetime:
@@ -85,15 +126,11 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (datetime): A new datetime object with the added timedelta.
         """
-        if dt_obj is None or not isinstance(dt_obj, dt.datetime):
+        if not isinstance(dt_obj, dt.datetime):
             msg = f"Invalid data type passed DateHelper.add_datetime({dt_obj}). Expected a datetime object."
             raise TypeError(msg)
 
-        try:
-            return dt_obj + dt.timedelta(**kwargs)
-        except TypeError as e:
-            msg = f"Invalid keyword arguments for timedelta in DateHelper.add_datetime(dt_obj={dt_obj}, kwargs={kwargs}): {e}"
-            raise TypeError(msg) from e
+        return DateHelper._add_timedelta(dt_obj, kwargs, "add_datetime")  # type: ignore[return-value]
 
     @staticmethod
     def add_timezone(dt_obj: dt.datetime, tzinfo: dt.tzinfo | None = None) -> dt.datetime:
@@ -102,7 +139,7 @@ class DateHelper:  # noqa: PLR0904
 
         Args:
             dt_obj (datetime): The datetime object to which the timezone information will be added.
-            tzinfo (tzinfo): The timezone information to add to the datetime object. Defaults to the local timezone if not provided.
+            tzinfo (tzinfo): The timezone information to add to the datetime object. Defaults to the local timezone if not provided. Use fixed_offset() for a fixed UTC offset.
 
         Raises:
             TypeError: If dt_obj is not a date or datetime object, or if the keyword arguments are not valid for a timedelta.
@@ -110,11 +147,11 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (datetime): A new datetime object with the added timezone information, or None if dt_obj is None or not a datetime object.
         """
-        if dt_obj is None or not isinstance(dt_obj, dt.datetime):
+        if not isinstance(dt_obj, dt.datetime):
             msg = f"Invalid data type passed DateHelper.add_timezone({dt_obj}). Expected a datetime object."
             raise TypeError(msg)
         if tzinfo is None:
-            tzinfo = DateHelper.get_local_timezone()
+            tzinfo = _LOCAL_TZ
         return dt_obj.replace(tzinfo=tzinfo)
 
     @staticmethod
@@ -133,14 +170,14 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (datetime): A datetime object combining the date and time, with the specified timezone information.
         """
-        if date_obj is None or not isinstance(date_obj, dt.date):
+        if not isinstance(date_obj, dt.date):
             msg = f"Invalid data type for date_obj in DateHelper.combine(date_obj={date_obj}, time_obj={time_obj}): Expected a date object."
             raise TypeError(msg)
-        if time_obj is None or not isinstance(time_obj, dt.time):
+        if not isinstance(time_obj, dt.time):
             msg = f"Invalid data type for time_obj in DateHelper.combine(date_obj={date_obj}, time_obj={time_obj}): Expected a time object."
             raise TypeError(msg)
         if tzinfo is None:
-            tzinfo = DateHelper.get_local_timezone()
+            tzinfo = _LOCAL_TZ
         return dt.datetime.combine(date_obj, time_obj, tzinfo=tzinfo)
 
     @staticmethod
@@ -158,13 +195,16 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (datetime): A new datetime object representing the same moment in time as dt_obj, but with the specified timezone information.
         """
-        if dt_obj is None or not isinstance(dt_obj, dt.datetime):
+        if not isinstance(dt_obj, dt.datetime):
             msg = f"Invalid data type for dt_obj in DateHelper.convert_timezone(dt_obj={dt_obj}, tzinfo={tzinfo}): Expected a datetime object."
             raise TypeError(msg)
         if tzinfo is None:
-            tzinfo = DateHelper.get_local_timezone()
+            tzinfo = _LOCAL_TZ
+        # Most datetimes are already in the target timezone, which is usually the very same (cached) tzinfo object
+        if dt_obj.tzinfo is tzinfo:
+            return dt_obj
         if dt_obj.tzinfo is None:
-            dt_obj = DateHelper.add_timezone(dt_obj, tzinfo=tzinfo)
+            return dt_obj.replace(tzinfo=tzinfo)
         if dt_obj.tzinfo == tzinfo:
             return dt_obj
 
@@ -192,9 +232,11 @@ class DateHelper:  # noqa: PLR0904
             start_date = start_date.date()
         if isinstance(end_date, dt.datetime):
             end_date = end_date.date()
-        return (end_date - start_date).days
+        # Same as (end_date - start_date).days, without building a timedelta
+        return end_date.toordinal() - start_date.toordinal()
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def extract(dt_str: str, format_str: str | None = None, hide_tz: bool = False, dt_type: type | None = None) -> dt.date | dt.datetime | dt.time:  # noqa: PLR0912, PLR0915
         """
         Extract a date or datetime from a string.
@@ -202,6 +244,7 @@ class DateHelper:  # noqa: PLR0904
         format_str is optional. If not provided, the function will attempt to parse the string using the 'friendly date, datetime and time formats (see the format() function).
         If format_str is provided, it will be used to parse the string. If format_str is "ISO", the function will attempt to parse the string using the ISO 8601 format.
         If the string cannot be parsed using the provided format_str or the default formats, the function will raise a ValueError.
+        Results are cached, as the same strings tend to be parsed over and over (for example dates in CSV files).
 
         Args:
             dt_str (str): The string to extract the date, datetime, or time from.
@@ -217,7 +260,7 @@ class DateHelper:  # noqa: PLR0904
         """
         return_dt_obj = None
         if format_str is not None:  # noqa: PLR1702
-            if format_str.upper() == "ISO":
+            if format_str in _ISO_FORMAT_STRS:
                 # If dt_type is specified, only try parsing as that type
                 if dt_type is dt.datetime:
                     try:
@@ -270,35 +313,33 @@ class DateHelper:  # noqa: PLR0904
                 except ValueError as e:
                     error_msg = f"Could not parse date/datetime/time from string '{dt_str}' using format '{format_str}': {e}"
                     raise ValueError(error_msg) from e
-        else:  # noqa: PLR5501
-            # If dt_type is specified, only try parsing as that type
-            if dt_type is dt.datetime:
-                with contextlib.suppress(ValueError):
-                    return_dt_obj = dt.datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S%z")
-                if return_dt_obj is None:
-                    with contextlib.suppress(ValueError):
-                        return_dt_obj = dt.datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")  # noqa: DTZ007
-            elif dt_type is dt.date:
-                with contextlib.suppress(ValueError):
-                    return_dt_obj = dt.datetime.strptime(dt_str, "%Y-%m-%d").date()  # noqa: DTZ007
-            elif dt_type is dt.time:
-                with contextlib.suppress(ValueError):
-                    return_dt_obj = dt.datetime.strptime(dt_str, "%H:%M:%S.%f").time()  # noqa: DTZ007
-                if return_dt_obj is None:
+        else:
+            # Fast path for strings that are already in the zero padded default formats
+            for pattern, dt_class in _ISO_SHAPES:
+                if (dt_type is None or dt_type is dt_class) and pattern.fullmatch(dt_str):
                     with contextlib.suppress(ValueError):
-                        return_dt_obj = dt.datetime.strptime(dt_str, "%H:%M:%S").time()  # noqa: DTZ007
-            else:
-                # Try parsing as datetime first, then date, then time
-                with contextlib.suppress(ValueError):
-                    return dt.datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S%z")
-                with contextlib.suppress(ValueError):
-                    return dt.datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")  # noqa: DTZ007
-                with contextlib.suppress(ValueError):
-                    return dt.datetime.strptime(dt_str, "%Y-%m-%d").date()  # noqa: DTZ007
-                with contextlib.suppress(ValueError):
-                    return dt.datetime.strptime(dt_str, "%H:%M:%S.%f").time()  # noqa: DTZ007
-                with contextlib.suppress(ValueError):
-                    return dt.datetime.strptime(dt_str, "%H:%M:%S").time()  # noqa: DTZ007
+                        return_dt_obj = dt_class.fromisoformat(dt_str)
+                    break
+
+            # Untyped results are returned as is, without the timezone handling below
+            typed = dt_type in {dt.datetime, dt.date, dt.time}
+            if return_dt_obj is None:
+                # Otherwise try the default formats in turn: datetime first, then date, then time. If dt_type is specified, only try that type
+                for dt_class, default_formats in _DEFAULT_FORMATS:
+                    if typed and dt_class is not dt_type:
+                        continue
+                    parsed_dt = DateHelper._strptime_first(dt_str, default_formats)
+                    if parsed_dt is not None:
+                        if dt_class is dt.date:
+                            return_dt_obj = parsed_dt.date()
+                        elif dt_class is dt.time:
+                            return_dt_obj = parsed_dt.time()
+                        else:
+                            return_dt_obj = parsed_dt
+                        break
+
+            if return_dt_obj is not None and not typed:
+                return return_dt_obj
 
         if return_dt_obj is None:
             type_hint = f" as {dt_type.__name__}" if dt_type else ""
@@ -306,12 +347,13 @@ class DateHelper:  # noqa: PLR0904
             raise ValueError(error_msg)
 
         # If we have a datetime object with timezone info and hide_tz is True, remove the timezone info before returning the datetime object.
-        if isinstance(return_dt_obj, dt.datetime):
-            if hide_tz and return_dt_obj.tzinfo is not None:
+        # Everything parsed above is an exact datetime, date or time, so there's no need for the isinstance() subclass check
+        if type(return_dt_obj) is dt.datetime:
+            has_tz = return_dt_obj.tzinfo is not None
+            if hide_tz and has_tz:
                 return_dt_obj = return_dt_obj.replace(tzinfo=None)
-            if not hide_tz and return_dt_obj.tzinfo is None:
-                local_tz = DateHelper.get_local_timezone()
-                return_dt_obj = return_dt_obj.replace(tzinfo=local_tz)
+            elif not hide_tz and not has_tz:
+                return_dt_obj = return_dt_obj.replace(tzinfo=_LOCAL_TZ)
 
         return return_dt_obj
 
@@ -330,7 +372,8 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (date): A date object extracted from the string.
         """
-        return DateHelper.extract(dt_str, format_str=format_str, hide_tz=hide_tz, dt_type=dt.date)  # type: ignore[call-arg]
+        # Positional arguments make for a cheaper lookup in extract()'s cache than keyword ones
+        return DateHelper.extract(dt_str, format_str, hide_tz, dt.date)  # type: ignore[call-arg]
 
     @staticmethod
     def extract_datetime(dt_str: str, format_str: str | None = None, hide_tz: bool = False) -> dt.datetime:
@@ -347,7 +390,30 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (datetime): A datetime object extracted from the string.
         """
-        return DateHelper.extract(dt_str, format_str=format_str, hide_tz=hide_tz, dt_type=dt.datetime)  # type: ignore[call-arg]
+        return DateHelper.extract(dt_str, format_str, hide_tz, dt.datetime)  # type: ignore[call-arg]
+
+    @staticmethod
+    def extract_many(dt_strs: Iterable[str], format_str: str | None = None, hide_tz: bool = False, dt_type: type | None = None) -> list[dt.date | dt.datetime | dt.time]:
+        """
+        Extract a date, datetime or time from each string in an iterable, for example a column of dates read from a file.
+
+        The results are the same as calling extract() for each string, but the per call overhead is paid once for the whole batch.
+
+        Args:
+            dt_strs (Iterable[str]): The strings to extract the dates, datetimes, or times from.
+            format_str (Optional[str], optional): The format string to use for parsing. See extract() for more details.
+            hide_tz (bool, optional): Whether to remove timezone information from the extracted datetime objects. Defaults to False.
+            dt_type (type, optional): The type of object to extract (dt.date, dt.datetime, or dt.time). See extract() for more details.
+
+        Raises:
+            ValueError: If any of the strings cannot be parsed.
+
+        Returns:
+            result (list[date | datetime | time]): The extracted objects, in the same order as dt_strs.
+        """  # noqa: DOC502
+        # Bind the cached extract() once, and pass its arguments positionally as that's the cheapest cache lookup
+        extract = DateHelper.extract
+        return [extract(dt_str, format_str, hide_tz, dt_type) for dt_str in dt_strs]  # type: ignore[call-arg]
 
     @staticmethod
     def extract_time(dt_str: str, format_str: str | None = None, hide_tz: bool = False) -> dt.time:
@@ -364,7 +430,23 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (time): A time object extracted from the string.
         """
-        return DateHelper.extract(dt_str, format_str=format_str, hide_tz=hide_tz, dt_type=dt.time)  # type: ignore[call-arg]
+        return DateHelper.extract(dt_str, format_str, hide_tz, dt.time)  # type: ignore[call-arg]
+
+    @staticmethod
+    @functools.lru_cache(maxsize=2880)
+    def fixed_offset(total_minutes: int) -> dt.timezone:
+        """
+        Get a timezone with a fixed offset from UTC.
+
+        The timezone objects are cached, so use this rather than building a new timezone for every datetime when the same offset is used over and over.
+
+        Args:
+            total_minutes (int): The offset from UTC in minutes, e.g. 600 for UTC+10:00. Must be within +/- 24 hours.
+
+        Returns:
+            tzinfo (timezone): A timezone with the specified offset.
+        """
+        return dt.timezone(dt.timedelta(minutes=total_minutes))
 
     @staticmethod
     def format(dt_obj: dt.date | dt.datetime | dt.time, format_str: str | None = None, hide_tz: bool = True) -> str:
@@ -395,21 +477,20 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             formatted_str: The datetime object formatted as a string, or None if dt_obj is None or an unsupported type.
         """
-        if dt_obj is None or not isinstance(dt_obj, (dt.date, dt.datetime, dt.time)):
+        if not isinstance(dt_obj, (dt.date, dt.time)):
             error_msg = f"Invalid input for DateHelper.format(dt_obj={dt_obj}, format_str={format_str}): dt_obj must be provided and be a valid type."
             raise ValueError(error_msg)
         if format_str is None:
-            if isinstance(dt_obj, dt.datetime):
-                if dt_obj.tzinfo is not None and not hide_tz:
-                    format_str = "%Y-%m-%d %H:%M:%S%:z"
-                else:
-                    format_str = "%Y-%m-%d %H:%M:%S"
-            elif isinstance(dt_obj, dt.date):
-                format_str = "%Y-%m-%d"
-            elif isinstance(dt_obj, dt.time):
-                format_str = "%H:%M:%S"
+            dt_class = type(dt_obj)
+            if dt_class not in _DEFAULT_FORMAT_STRS:
+                # A subclass (a pandas Timestamp for example), so match it to the type it derives from. datetime is a subclass of date, so check it first
+                dt_class = dt.datetime if isinstance(dt_obj, dt.datetime) else dt.date if isinstance(dt_obj, dt.date) else dt.time
+            if dt_class is dt.datetime and dt_obj.tzinfo is not None and not hide_tz:
+                format_str = "%Y-%m-%d %H:%M:%S%:z"
+            else:
+                format_str = _DEFAULT_FORMAT_STRS[dt_class]
 
-        elif format_str.upper() == "ISO":
+        elif format_str in _ISO_FORMAT_STRS:
             # Use .isoformat() instead of strftime for ISO format to ensure correct formatting of timezone-aware datetimes
             return dt_obj.isoformat()
 
@@ -430,14 +511,13 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             date_obj (date): The last modified date of the file as a date object, or None if the file does not exist.
         """
-        if isinstance(file_path, str):
-            file_path = Path(file_path)
-
-        if not file_path.exists():
+        # A single stat() call tells us both whether the file exists and when it was modified
+        try:
+            mtime = os.stat(file_path).st_mtime  # noqa: PTH116
+        except OSError:
             return None
 
-        local_tz = DateHelper.get_local_timezone()
-        return dt.datetime.fromtimestamp(file_path.stat().st_mtime, tz=local_tz).date()
+        return dt.datetime.fromtimestamp(mtime, tz=_LOCAL_TZ).date()
 
     @staticmethod
     def get_file_datetime(file_path: str | Path) -> dt.datetime | None:
@@ -450,14 +530,12 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             datetime_obj (datetime): The last modified datetime of the file as a date object, or None if the file does not exist.
         """
-        if isinstance(file_path, str):
-            file_path = Path(file_path)
-
-        if not file_path.exists():
+        try:
+            mtime = os.stat(file_path).st_mtime  # noqa: PTH116
+        except OSError:
             return None
 
-        local_tz = DateHelper.get_local_timezone()
-        return dt.datetime.fromtimestamp(file_path.stat().st_mtime, tz=local_tz)
+        return dt.datetime.fromtimestamp(mtime, tz=_LOCAL_TZ)
 
     @staticmethod
     def get_local_timezone() -> dt.tzinfo:
@@ -467,7 +545,7 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             tzinfo (tzinfo): The local timezone of the system.
         """
-        return _LOCAL_TZ  # pyright: ignore[reportReturnType]
+        return _LOCAL_TZ
 
     @staticmethod
     def is_valid_date(date_str: str, format_str: str = "%Y-%m-%d") -> bool:
@@ -483,12 +561,15 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (bool): True if the date string is valid, False otherwise.
         """
-        local_tz = DateHelper.get_local_timezone()
+        fast_result = DateHelper._fast_validate(date_str, format_str)
+        if fast_result is not None:
+            return fast_result
+
         try:
-            if format_str.upper() == "ISO":
+            if format_str in _ISO_FORMAT_STRS:
                 dt.datetime.fromisoformat(date_str)
             else:
-                dt.datetime.strptime(date_str, format_str).replace(tzinfo=local_tz)
+                dt.datetime.strptime(date_str, format_str)  # noqa: DTZ007
         except ValueError:
             return False
         else:
@@ -508,12 +589,15 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (bool): True if the datetime string is valid, False otherwise.
         """
-        local_tz = DateHelper.get_local_timezone()
+        fast_result = DateHelper._fast_validate(dt_str, format_str)
+        if fast_result is not None:
+            return fast_result
+
         try:
-            if format_str.upper() == "ISO":
+            if format_str in _ISO_FORMAT_STRS:
                 dt.datetime.fromisoformat(dt_str)
             else:
-                dt.datetime.strptime(dt_str, format_str).replace(tzinfo=local_tz)
+                dt.datetime.strptime(dt_str, format_str)  # noqa: DTZ007
         except ValueError:
             return False
         else:
@@ -533,12 +617,15 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (bool): True if the time string is valid, False otherwise.
         """
-        local_tz = DateHelper.get_local_timezone()
+        fast_result = DateHelper._fast_validate(time_str, format_str)
+        if fast_result is not None:
+            return fast_result
+
         try:
-            if format_str.upper() == "ISO":
+            if format_str in _ISO_FORMAT_STRS:
                 dt.datetime.fromisoformat(time_str)
             else:
-                dt.datetime.strptime(time_str, format_str).replace(tzinfo=local_tz)
+                dt.datetime.strptime(time_str, format_str)  # noqa: DTZ007
         except ValueError:
             return False
         else:
@@ -557,10 +644,13 @@ class DateHelper:  # noqa: PLR0904
             result (datetime): Today's date at midnight as a datetime object, using the local timezone.
         """
         if tzinfo is None:
-            tzinfo = DateHelper.get_local_timezone()
+            tzinfo = _LOCAL_TZ
         if dt_date is None:
             dt_date = DateHelper.today(tzinfo=tzinfo)
-        return DateHelper.combine(dt_date, dt.time(0, 0, 0), tzinfo=tzinfo)
+        elif not isinstance(dt_date, dt.date):
+            # Let combine() raise its usual error
+            return DateHelper.combine(dt_date, _MIDNIGHT, tzinfo=tzinfo)
+        return dt.datetime.combine(dt_date, _MIDNIGHT, tzinfo=tzinfo)
 
     @staticmethod
     def now(tzinfo: dt.tzinfo | None = None) -> dt.datetime:
@@ -574,7 +664,7 @@ class DateHelper:  # noqa: PLR0904
             result (datetime): Today's date and time as a date object, using the local timezone.
         """
         if tzinfo is None:
-            tzinfo = DateHelper.get_local_timezone()
+            tzinfo = _LOCAL_TZ
 
         freeze_time = DateHelper._get_frozen_time()
         if freeze_time is not None:
@@ -595,7 +685,17 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (str): Current time as a formatted string, using the specified datetime format.
         """
-        return DateHelper.format(DateHelper.now(tzinfo=tzinfo), format_str)  # type: ignore[call-arg]
+        # This is often called for every log entry, so format the datetime directly rather than going through format()
+        now = DateHelper.now(tzinfo=tzinfo)
+        if format_str is None:
+            format_str = "%Y-%m-%d %H:%M:%S"
+        elif format_str in _ISO_FORMAT_STRS:
+            return now.isoformat()
+        try:
+            return now.strftime(format_str)
+        except ValueError:
+            # Let format() report the bad format string in the usual way
+            return DateHelper.format(now, format_str)  # type: ignore[call-arg]
 
     @staticmethod
     def now_utc() -> dt.datetime:
@@ -621,8 +721,7 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (date): Today's date as a date object, using the local timezone.
         """
-        if tzinfo is None:
-            tzinfo = DateHelper.get_local_timezone()
+        # now() falls back to the cached local timezone, so no need to resolve it here as well
         return DateHelper.now(tzinfo=tzinfo).date()
 
     @staticmethod
@@ -637,7 +736,16 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (date): Today's date offset by the specified number of days.
         """
-        return DateHelper.add(DateHelper.today(tzinfo=tzinfo), days=days)  # type: ignore[call-arg]
+        today = DateHelper.today(tzinfo=tzinfo)
+
+        # Whole days can be added to the day number directly, without building a timedelta
+        if isinstance(days, int):
+            ordinal = today.toordinal() + days
+            if 1 <= ordinal <= _MAX_DATE_ORDINAL:
+                return dt.date.fromordinal(ordinal)
+
+        # Fractional days, or a result out of range, which add() will report
+        return DateHelper.add(today, days=days)  # type: ignore[call-arg]
 
     @staticmethod
     def today_str(format_str: str | None = "%Y-%m-%d") -> str:
@@ -652,7 +760,16 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (str): Today's date as a formatted string, using the specified date format.
         """
-        return DateHelper.format(DateHelper.today(), format_str)  # type: ignore[call-arg]
+        # Format the date directly rather than going through format(), see now_str()
+        today = DateHelper.today()
+        if format_str is None:
+            format_str = "%Y-%m-%d"
+        elif format_str in _ISO_FORMAT_STRS:
+            return today.isoformat()
+        try:
+            return today.strftime(format_str)
+        except ValueError:
+            return DateHelper.format(today, format_str)  # type: ignore[call-arg]
 
     @staticmethod
     def today_utc() -> dt.date:
@@ -681,7 +798,7 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (datetime): A new datetime object with the timezone information removed.
         """
-        if dt_obj is None or not isinstance(dt_obj, dt.datetime):
+        if not isinstance(dt_obj, dt.datetime):
             msg = f"Invalid data type passed DateHelper.remove_timezone({dt_obj}). Expected a datetime object."
             raise TypeError(msg)
         return dt_obj.replace(tzinfo=None)
@@ -736,10 +853,23 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             date_obj (date | datetime): A date or datetime object representing the parsed date_str, or None if date_str is empty.
         """
-        local_tz = DateHelper.get_local_timezone()
         if not date_str:
             return None
-        parsed_dt = dt.datetime.strptime(date_str, date_format).replace(tzinfo=local_tz)
+
+        # The default date and datetime formats can be parsed with the same pre-compiled patterns as the is_valid_*() functions
+        fast_parser = _FAST_VALIDATORS.get(date_format)
+        if fast_parser is not None and fast_parser[1] is not dt.time and isinstance(date_str, str):
+            pattern, dt_class = fast_parser
+            match = pattern.fullmatch(date_str)
+            if match is not None:
+                try:
+                    if dt_class is dt.date:
+                        return dt.date(*(int(group.strip()) for group in match.groups()))
+                    return dt.datetime(*(int(group.strip()) for group in match.groups()), tzinfo=_LOCAL_TZ)
+                except ValueError:
+                    pass  # Out of range, let strptime() raise its usual error
+
+        parsed_dt = dt.datetime.strptime(date_str, date_format).replace(tzinfo=_LOCAL_TZ)
 
         # If the date_format string conatins only date components (like "%Y-%m-%d"), return a date object.
         # If it contains time components (like "%Y-%m-%d %H:%M:%S"), return a datetime object.
@@ -778,13 +908,13 @@ class DateHelper:  # noqa: PLR0904
 
                 # Add local timezone if missing
                 if frozen_dt.tzinfo is None:
-                    frozen_dt = frozen_dt.replace(tzinfo=DateHelper.get_local_timezone())
+                    frozen_dt = frozen_dt.replace(tzinfo=_LOCAL_TZ)
 
                 # Handle one_time feature
                 one_time = config.get("one_time", False)
                 if one_time:
                     # Calculate offset from current time to frozen time
-                    actual_now = dt.datetime.now(tz=DateHelper.get_local_timezone())
+                    actual_now = dt.datetime.now(tz=_LOCAL_TZ)
                     time_diff = frozen_dt - actual_now
 
                     # Convert to the largest appropriate unit
@@ -831,7 +961,7 @@ class DateHelper:  # noqa: PLR0904
                 kwargs = {offset_unit: offset_amount}
                 offset = dt.timedelta(**kwargs)
 
-                actual_now = dt.datetime.now(tz=DateHelper.get_local_timezone())
+                actual_now = dt.datetime.now(tz=_LOCAL_TZ)
                 return actual_now + offset
             except (TypeError, ValueError):
                 pass  # Invalid offset parameters
@@ -846,34 +976,123 @@ class DateHelper:  # noqa: PLR0904
         Returns:
             result (Path | None): The path to the "freeze_time.json" file if found, otherwise None.
         """
-        current_dir = Path.cwd()
-        project_root = SCCommon.get_project_root()
-        logs_dir = project_root / "logs"
-        for folder in [current_dir, project_root, logs_dir]:
-            freeze_time_file = folder / "freeze_time.json"
-            if freeze_time_file.exists():
-                return freeze_time_file
+        # This runs on every call to now(), so stick to plain string paths, building Path objects costs more than the stat() calls.
+        # The file can be created or removed at any time, so we have to look for it every time, but the paths to check rarely change.
+        current_dir = os.getcwd()  # noqa: PTH109
+        project_root = os.fspath(SCCommon.get_project_root())
+        for freeze_time_file in DateHelper._freeze_time_file_candidates(current_dir, project_root):
+            if os.path.exists(freeze_time_file):  # noqa: PTH110
+                return Path(freeze_time_file)
+        return None
+
+    @staticmethod
+    @functools.cache
+    def _freeze_time_file_candidates(current_dir: str, project_root: str) -> tuple[str, ...]:
+        """
+        Build the paths where a "freeze_time.json" file may be found, in the order they should be checked.
+
+        Args:
+            current_dir (str): The current working directory.
+            project_root (str): The project root folder.
+
+        Returns:
+            result (tuple[str, ...]): The paths to check.
+        """
+        folders = (current_dir, project_root, os.path.join(project_root, "logs"))  # noqa: PTH118
+        return tuple(os.path.join(folder, "freeze_time.json") for folder in folders)  # noqa: PTH118
+
+    @staticmethod
+    def _fast_validate(value: str, format_str: str) -> bool | None:
+        """
+        Validate a string against one of the default formats using a pre-compiled regex rather than strptime().
+
+        Args:
+            value (str): The string to check.
+            format_str (str): The format string to check against.
+
+        Returns:
+            result (bool | None): True or False if the format has a fast path, otherwise None.
+        """
+        fast_validator = _FAST_VALIDATORS.get(format_str)
+        if fast_validator is None or not isinstance(value, str):
+            return None
+
+        pattern, dt_class = fast_validator
+        match = pattern.fullmatch(value)
+        if match is None:
+            # Leave anything outside the patterns' ASCII range to strptime()
+            return False if value.isascii() else None
+        try:
+            # Let the constructor range check the values (month 13, Feb 30, 25:00:00 etc.)
+            dt_class(*(int(group.strip()) for group in match.groups()))
+        except ValueError:
+            return False
+        return True
+
+    @staticmethod
+    def _add_timedelta(dt_obj: dt.date, kwargs: dict, method_name: str) -> dt.date:
+        """
+        Add a timedelta built from keyword arguments to a date or datetime object that the calling add*() method has already type checked.
+
+        Args:
+            dt_obj (date | datetime): The date or datetime object to which the timedelta will be added.
+            kwargs (dict): The keyword arguments to pass to the timedelta constructor.
+            method_name (str): The name of the calling method, for the error message.
+
+        Raises:
+            TypeError: If the keyword arguments are not valid for a timedelta.
+
+        Returns:
+            result (date | datetime): A new date or datetime object with the added timedelta.
+        """
+        try:
+            # A lone days=N is the usual case, and passing it positionally skips timedelta's keyword handling
+            if len(kwargs) == 1 and "days" in kwargs:
+                return dt_obj + dt.timedelta(kwargs["days"])
+            return dt_obj + dt.timedelta(**kwargs)
+        except TypeError as e:
+            msg = f"Invalid keyword arguments for timedelta in DateHelper.{method_name}(dt_obj={dt_obj}, kwargs={kwargs}): {e}"
+            raise TypeError(msg) from e
+
+    @staticmethod
+    def _strptime_first(dt_str: str, format_strs: tuple[str, ...]) -> dt.datetime | None:
+        """
+        Parse a string with the first of the format strings that matches it.
+
+        Args:
+            dt_str (str): The string to parse.
+            format_strs (tuple[str, ...]): The format strings to try, in order.
+
+        Returns:
+            result (datetime | None): The parsed datetime, or None if none of the format strings match.
+        """
+        for format_str in format_strs:
+            try:
+                return dt.datetime.strptime(dt_str, format_str)  # noqa: DTZ007
+            except ValueError:
+                continue
         return None
 
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _classify_format_str(format_str: str) -> str:
         """
         Classify the format string as "date", "datetime", or "time" based on its content.
 
+        Results are cached, as there are only ever a handful of distinct format strings in use.
+
         Args:
             format_str (str | None): The format string to classify.
 
         Returns:
             result (str): The classification of the format string ("date", "datetime", or "time").
         """
-        date_format_tokens = ["%Y", "%y", "%B", "%m", "%A", "%a", "%d", "%j"]
-        time_format_tokens = ["%H", "%I", "%p", "%M", "%S", "%f", "%z", "%Z"]
         if format_str is None:
             return "datetime"
-        if any(x in format_str for x in date_format_tokens):
-            if any(x in format_str for x in time_format_tokens):
-                return "datetime"
+        has_date = _DATE_FORMAT_TOKENS.search(format_str) is not None
+        has_time = _TIME_FORMAT_TOKENS.search(format_str) is not None
+        if has_date and not has_time:
             return "date"
-        if any(x in format_str for x in time_format_tokens):
+        if has_time and not has_date:
             return "time"
         return "datetime"
@@ -478,6 +478,35 @@ class SCLogger:
 
         return False
 
+    def wait_notifiable_issue(self, entity: str, issue_type: str, message: str, wake_event: threading.Event | None = None) -> bool:
+        """
+        Block until a previously reported notifiable issue is due for notification, then report it again.
+
+        Use this instead of polling report_notifiable_issue() in a sleep loop. The wait lasts exactly as long as is left of the
+        issue's send_delay, and can be cut short by setting wake_event.
+
+        Args:
+            entity (str): The entity that reported the issue.
+            issue_type (str): The issue type that was reported.
+            message (str): The issue message to log and email.
+            wake_event (threading.Event | None): An optional event that will end the wait early when set.
+
+        Returns:
+            result (bool): True if the email was sent, False otherwise (including if the issue hasn't been reported or the wait was interrupted).
+        """
+        issue = next((i for i in self.notifiable_issues if i.entity == entity and i.issue_type == issue_type), None)
+        if issue is None:
+            return False
+
+        remaining = issue.send_delay - (DateHelper.now() - issue.first_reported).total_seconds()
+        if remaining > 0:
+            if wake_event is None:
+                wake_event = threading.Event()
+            if wake_event.wait(timeout=remaining):
+                return False
+
+        return self.report_notifiable_issue(entity, issue_type, issue.send_delay, message)
+
     def clear_notifiable_issue(self, entity: str, issue_type: str) -> bool:
         """
         Clear a notifiable issue.
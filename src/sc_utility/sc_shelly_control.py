@@ -1,13 +1,22 @@
 """ShellyControl class for controlling Shelly Smart Switch devices."""
+import asyncio
 import datetime as dt
 import json
 import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from http.server import ThreadingHTTPServer
 from importlib import resources
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, we fall back to the requests JSON decoder if it's not installed
+    orjson = None
 
 from sc_utility.sc_common import SCCommon
 from sc_utility.sc_date_helper import DateHelper
@@ -19,6 +28,7 @@ DEFAULT_WEBHOOK_HOST = "0.0.0.0"  # noqa: S104
 DEFAULT_WEBHOOK_PORT = 8787
 DEFAULT_WEBHOOK_PATH = "/shelly/webhook"
 FIRST_TEMP_PROBE_ID = 100
+HTTP_POOL_SIZE = 32  # Max devices polled concurrently, and keep-alive connections held per device host
 
 
 class ShellyControl:
@@ -42,6 +52,15 @@ class ShellyControl:
         self.retry_count = 1        # Number of times to retry a request
         self.retry_delay = 2        # Number of seconds to wait between retries
         self.ping_allowed = True    # Whether to allow pinging the devices
+        self.min_refresh_interval = 0   # Minimum number of seconds between device status refreshes. 0 to always refresh
+        self._last_refresh_time: float | None = None   # time.monotonic() of the last completed refresh_all_device_statuses(), None until the first one
+
+        # Keep-alive HTTP session shared by all REST and RPC calls so that repeated polls reuse the TCP connection to each device
+        self._http = requests.Session()
+        self._http.mount("http://", HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE))
+
+        # Worker pool used to poll all the devices concurrently in refresh_all_device_statuses(). Threads are only started as needed.
+        self._poll_pool = ThreadPoolExecutor(max_workers=HTTP_POOL_SIZE, thread_name_prefix="ShellyPoll")
 
         self.webhook_host = DEFAULT_WEBHOOK_HOST
         self.webhook_port = DEFAULT_WEBHOOK_PORT
@@ -49,7 +68,7 @@ class ShellyControl:
         self.default_webhook_events = {}
         self.app_wake_event = app_wake_event
         self.webhook_enabled = device_settings.get("WebhooksEnabled", False) and self.app_wake_event is not None
-        self.webhook_event_queue = []
+        self.webhook_event_queue = deque()  # Appended to by the webhook server thread. deque append/popleft are thread safe
         self.webhook_server = None  # Add this to store the server instance
 
         self.devices = []           # List to hold multiple Shelly devices
@@ -57,6 +76,7 @@ class ShellyControl:
         self.outputs = []           # List to hold multiple relay outputs, each one associated with a Shelly device
         self.meters = []            # List to hold multiple energy meters, each one associated with a Shelly device
         self.temp_probes = []       # List to hold multiple temperature probes, each one associated with a Shelly device
+        self._component_index = {}  # Component lookup by type, then ID or name. Rebuilt by initialize_settings()
 
         # Load up the model library
         try:
@@ -92,7 +112,7 @@ class ShellyControl:
 
         # If requested, refresh the status of the devices
         if refresh_status:
-            self.refresh_all_device_statuses()
+            self.refresh_all_device_statuses(force=True)
 
         # Get the supported webhooks for each device if it's online
         self._set_supported_webhooks()
@@ -103,7 +123,7 @@ class ShellyControl:
         # Finished
         self._log_debug_message("ShellyControl initialized successfully.")
 
-    def install_webhook(self, event: str, component: dict, url: str | None = None, additional_payload: dict | None = None) -> None:  # noqa: PLR0912
+    def install_webhook(self, event: str, component: dict, url: str | None = None, additional_payload: dict | None = None) -> None:
         """Install a webhook for the specified device and component.
 
         The function is used internally to install input and/or output webhooks that will be handled by the ShellyControl webhook
@@ -136,77 +156,7 @@ class ShellyControl:
         # Get the device object
         device = self.get_device(component)
 
-        # Look at the name keys in the device["SupportedWebhooks"] list of dicts and return if not found
-        if not any(webhook.get("name") == event for webhook in device.get("SupportedWebhooks", [])):
-            error_msg = f"Event {event} is not supported for component {component.get('Name')}"
-            raise RuntimeError(error_msg)
-
-        # Skip if device is offline
-        if not device.get("Online", False):
-            self.logger.log_message(f"Device {device.get('Name')} is offline, unable to install webhook {event}.", "warning")
-            device["WebhookInstallPending"] = True
-            return
-
-        # Formulate the payload URL
-        if url is None:
-            payload_url = f"http://{self.webhook_host}:{self.webhook_port}{self.webhook_path}?Event={event}&DeviceID={device.get('ID')}&ObjectType={component.get('ObjectType')}&ComponentID={component.get('ID')}"
-        else:
-            payload_url = url
-            # Now add the Event, DeviceIndex and ComponentIndex if not already present in the passed url
-
-            def add_arg(url, arg):
-                # If there are no URL arguments, start with '?', else use '&'
-                if "?" not in url:
-                    return url + "?" + arg
-                return url + "&" + arg
-
-            if "Event" not in url:
-                payload_url = add_arg(payload_url, f"Event={event}")
-            if "DeviceID" not in url:
-                payload_url = add_arg(payload_url, f"DeviceID={device.get('ID')}")
-            if "ObjectType" not in url:
-                payload_url = add_arg(payload_url, f"ObjectType={component.get('ObjectType')}")
-            if "ComponentID" not in url:
-                payload_url = add_arg(payload_url, f"ComponentID={component.get('ID')}")
-
-            # Now add any additional payload parameters
-            if additional_payload:
-                for key, value in additional_payload.items():
-                    payload_url = add_arg(payload_url, f"{key}={value}")
-
-        # Install the webhook
-        try:
-            error_msg = None
-            payload = {
-                "id": 0,
-                "method": "Webhook.Create",
-                "params": {
-                    "cid": component.get("ComponentIndex"),
-                    "enable": True,
-                    "event": event,
-                    "name": f"{component.get('Name')}: {event}",
-                    "urls": [str(payload_url)]
-                }
-            }
-            result, result_data = self._rpc_request(device, payload)
-            if result:
-                self._log_debug_message(f"Installed {event} webhook rev {result_data.get('rev')} for on component {component.get('Name')}")
-            else:
-                error_msg = f"Failed to create {event} webhook for component {component.get('Name')}: {result_data}"
-                self.logger.log_message(error_msg, "error")
-                # We will raise a RunTime error below
-
-        except TimeoutError as e:
-            error_msg = f"Timeout error installing web hooks for device {device.get('Name')}: {e}"
-            self.logger.log_message(error_msg, "error")
-            raise RuntimeError(error_msg) from e
-        except RuntimeError as e:
-            error_msg = f"Error installing web hooks for device {device.get('Name')}: {e}"
-            self.logger.log_message(error_msg, "error")
-            raise RuntimeError(error_msg) from e
-        else:
-            if error_msg:
-                raise RuntimeError(error_msg)
+        if self._create_webhook(device, event, component, url, additional_payload):
             # Finally record what webhooks we have installed
             self._list_installed_webhooks(device)
 
@@ -215,13 +165,15 @@ class ShellyControl:
 
         Use this if your app has been interrupted by a webhook event (your app_wake_event was set).
         This will return the earliest webhook event that was received and remove it from the queue.
+        Several events can arrive before your app wakes, so keep calling this until it returns None.
 
         Returns:
             dict | None: The next webhook event from the queue, or None if the queue is empty.
         """
-        if self.webhook_event_queue:
-            return self.webhook_event_queue.pop(0)
-        return None
+        try:
+            return self.webhook_event_queue.popleft()
+        except IndexError:
+            return None
 
     def get_device(self, device_identity: dict | int | str) -> dict:
         """Returns the device index for a given device ID or name.
@@ -266,6 +218,17 @@ class ShellyControl:
         Returns:
             component(dict): The component index if found.
         """
+        # The lookup table is built by initialize_settings(), until then fall back to searching the component lists
+        if not use_index and self._component_index:
+            component = self._component_index.get(component_type, {}).get(component_identity)
+            if component is not None:
+                return component
+            if component_type not in self._component_index:
+                error_msg = f"Invalid component type '{component_type}'. Must be one of: 'input', 'output', or 'meter'."
+                raise RuntimeError(error_msg)
+            error_msg = f"Device component {component_type} with identity {component_identity} not found."
+            raise RuntimeError(error_msg)
+
         # Select the appropriate list based on the component type
         if component_type == "input":
             component_list = self.inputs
@@ -530,21 +493,31 @@ class ShellyControl:
                 # And if the meters are separate, we need to get the status of each of the meters as well
                 # EM1.GetStatus gives use power, voltage, current
                 # EM1Data.GetStatus gives us energy
+                # Shelly.GetStatus normally already includes these as em1:N and em1data:N, so only make the extra
+                # round trips for any meter that's missing from the combined status
                 if device["MetersSeperate"]:
                     for meter_index in range(device["Meters"]):
-                        payload = {"id": 0,
-                                "method": "EM1.GetStatus",
-                                "params": {"id": meter_index}
-                                }
-                        em_result, meter_data = self._rpc_request(device, payload)
+                        meter_data = result_data.get(f"em1:{meter_index}")
+                        if meter_data is None:
+                            payload = {"id": 0,
+                                    "method": "EM1.GetStatus",
+                                    "params": {"id": meter_index}
+                                    }
+                            em_result, meter_data = self._rpc_request(device, payload)
+                        else:
+                            em_result = True
                         if em_result:
                             em_result_data.append(meter_data)
 
-                        payload = {"id": 0,
-                                "method": "EM1Data.GetStatus",
-                                "params": {"id": meter_index}
-                                }
-                        em_result, meter_data = self._rpc_request(device, payload)
+                        meter_data = result_data.get(f"em1data:{meter_index}")
+                        if meter_data is None:
+                            payload = {"id": 0,
+                                    "method": "EM1Data.GetStatus",
+                                    "params": {"id": meter_index}
+                                    }
+                            em_result, meter_data = self._rpc_request(device, payload)
+                        else:
+                            em_result = True
                         if em_result:
                             emdata_result_data.append(meter_data)
             elif device["Protocol"] == "REST":
@@ -709,21 +682,44 @@ class ShellyControl:
 
         return False
 
-    def refresh_all_device_statuses(self) -> None:
+    def refresh_all_device_statuses(self, force: bool = False) -> None:
         """Refreshes the status of all Shelly devices.
 
-        This function iterates through all devices and updates their status by calling get_device_status.
+        This function polls all devices concurrently and updates their status by calling get_device_status.
         It also calculates the total power and energy consumption for each device.
+        If MinRefreshInterval is configured, calls made within that many seconds of the last refresh return straight away
+        and the devices keep their current status.
+
+        Args:
+            force (bool): If True, always refresh, ignoring MinRefreshInterval.
 
         Raises:
             RuntimeError: If there is an error getting the status of any device.
         """
-        for device in self.devices:
-            try:
-                self.get_device_status(device)
-            except RuntimeError as e:
-                self.logger.log_message(f"Error refreshing status for device {device['Label']}: {e}", "error")
-                raise RuntimeError(e) from e
+        if not force and not self._is_refresh_due():
+            return
+
+        # Each worker only updates the components of its own device, so no locking is needed
+        list(self._poll_pool.map(self._refresh_device_status, self.devices))
+        self._last_refresh_time = time.monotonic()
+
+    async def refresh_all_device_statuses_async(self, force: bool = False) -> None:
+        """Awaitable version of refresh_all_device_statuses() for apps that run an asyncio event loop.
+
+        The device polls run concurrently on the ShellyControl worker pool, so the event loop is never blocked while waiting on the devices.
+
+        Args:
+            force (bool): If True, always refresh, ignoring MinRefreshInterval.
+
+        Raises:
+            RuntimeError: If there is an error getting the status of any device.
+        """
+        if not force and not self._is_refresh_due():
+            return
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self._poll_pool, self._refresh_device_status, device) for device in self.devices))
+        self._last_refresh_time = time.monotonic()
 
     def change_output(self, output_identity: dict | int | str, new_state: bool) -> tuple[bool, bool]:
         """Change the state of a Shelly device output to on or off.
@@ -906,7 +902,7 @@ class ShellyControl:
         return device_info
 
     def shutdown(self):
-        """Cleanly shutdown the ShellyControl instance and stop the webhook server.
+        """Cleanly shutdown the ShellyControl instance, stop the webhook server and close the HTTP session.
 
         This method should be called when the parent application is terminating
         to ensure proper cleanup of resources.
@@ -917,8 +913,37 @@ class ShellyControl:
             self.webhook_server.server_close()
             self.webhook_server = None
 
+        self._poll_pool.shutdown(wait=False)
+        self._http.close()
+
 # PRIVATE FUNCTIONS ===========================================================
 
+    def _is_refresh_due(self) -> bool:
+        """Checks whether MinRefreshInterval has passed since the last full device refresh.
+
+        Returns:
+            result (bool): True if the devices should be refreshed, False if the last refresh is still recent enough.
+        """
+        # monotonic() counts from an arbitrary point (boot time on Linux), so there's no "long ago" value we can start from
+        if not self.min_refresh_interval or self._last_refresh_time is None:
+            return True
+        return time.monotonic() - self._last_refresh_time >= self.min_refresh_interval
+
+    def _refresh_device_status(self, device: dict) -> None:
+        """Refreshes the status of a single device on behalf of refresh_all_device_statuses().
+
+        Args:
+            device (dict): The Shelly device to refresh.
+
+        Raises:
+            RuntimeError: If there is an error getting the status of the device.
+        """
+        try:
+            self.get_device_status(device)
+        except RuntimeError as e:
+            self.logger.log_message(f"Error refreshing status for device {device['Label']}: {e}", "error")
+            raise RuntimeError(e) from e
+
     def _log_debug_message(self, message: str) -> None:
         """Logs a debug message.
 
@@ -1018,6 +1043,12 @@ class ShellyControl:
         if not self.webhook_enabled:
             return
 
+        # Group the components that have the Webhooks attribute set by device, so we only walk the component lists once
+        webhook_components = {}
+        for component in self.inputs + self.outputs + self.meters:
+            if component.get("Webhooks"):
+                webhook_components.setdefault(component["DeviceIndex"], []).append(component)
+
         for device in self.devices:
             if selected_device and device["Index"] != selected_device["Index"]:
                 continue
@@ -1042,27 +1073,123 @@ class ShellyControl:
                 self.logger.log_message(f"Failed to delete existing web hooks for device {device.get('Name')}: {result_data}", "error")
                 continue
 
-            # Now itterate through the inputs and outputs for each device and see which components have the Webhooks attribute set
-            for component in self.inputs + self.outputs + self.meters:
-                if component["DeviceIndex"] != device["Index"]:
-                    continue
-
-                # If the component does not have the Webhooks attribute, skip it
-                if "Webhooks" not in component or not component["Webhooks"]:
-                    continue
+            # If none of this device's components want webhooks, we know nothing is installed now
+            device_components = webhook_components.get(device["Index"])
+            if not device_components:
+                device["InstalledWebhooks"] = []
+                continue
 
+            # Now itterate through the inputs and outputs for this device that have the Webhooks attribute set
+            for component in device_components:
                 # Get the list of default or configured events for this type of component
                 configured_events = self._get_default_webhook_events_for_component(component)
 
                 # Install each of these events
                 for event in configured_events:
                     try:
-                        self.install_webhook(event, component)
+                        self._create_webhook(device, event, component)
                     except RuntimeError as e:
                         error_msg = f"Error installing webhook for event {event} on component {component.get('Name')} of device {device.get('Name')}: {e}"
                         self.logger.log_message(error_msg, "error")
                         raise RuntimeError(error_msg) from e
 
+            # Record what webhooks we have installed with a single Webhook.List call, rather than one after every Webhook.Create
+            self._list_installed_webhooks(device)
+
+    def _create_webhook(self, device: dict, event: str, component: dict, url: str | None = None, additional_payload: dict | None = None) -> bool:  # noqa: PLR0912
+        """Create a webhook on the device without refreshing the device's InstalledWebhooks list. See install_webhook() for details.
+
+        Args:
+            device (dict): The device object that the component belongs to.
+            event (str): The event type to install the webhook for.
+            component (dict): The component object for the device component that you want to install the webhook on.
+            url (str | None): The URL to send the webhook to. If None, the URL will be constructed using the webhook host, port, and path.
+            additional_payload (dict | None): Additional key/value pairs to include in the webhook payload.
+
+        Raises:
+            RuntimeError: If the webhook installation fails.
+
+        Returns:
+            bool: True if the webhook was created, False if the device is offline and the install has been left pending.
+        """
+        # Look these up once as they're used in the URL, payload and log messages below
+        component_name = component.get("Name")
+        device_id = device.get("ID")
+        object_type = component.get("ObjectType")
+        component_id = component.get("ID")
+
+        # Look at the name keys in the device["SupportedWebhooks"] list of dicts and return if not found
+        if not any(webhook.get("name") == event for webhook in device.get("SupportedWebhooks", [])):
+            error_msg = f"Event {event} is not supported for component {component_name}"
+            raise RuntimeError(error_msg)
+
+        # Skip if device is offline
+        if not device.get("Online", False):
+            self.logger.log_message(f"Device {device.get('Name')} is offline, unable to install webhook {event}.", "warning")
+            device["WebhookInstallPending"] = True
+            return False
+
+        # Formulate the payload URL
+        if url is None:
+            payload_url = f"http://{self.webhook_host}:{self.webhook_port}{self.webhook_path}?Event={event}&DeviceID={device_id}&ObjectType={object_type}&ComponentID={component_id}"
+        else:
+            payload_url = url
+            # Now add the Event, DeviceIndex and ComponentIndex if not already present in the passed url
+
+            def add_arg(url, arg):
+                # If there are no URL arguments, start with '?', else use '&'
+                if "?" not in url:
+                    return url + "?" + arg
+                return url + "&" + arg
+
+            if "Event" not in url:
+                payload_url = add_arg(payload_url, f"Event={event}")
+            if "DeviceID" not in url:
+                payload_url = add_arg(payload_url, f"DeviceID={device_id}")
+            if "ObjectType" not in url:
+                payload_url = add_arg(payload_url, f"ObjectType={object_type}")
+            if "ComponentID" not in url:
+                payload_url = add_arg(payload_url, f"ComponentID={component_id}")
+
+            # Now add any additional payload parameters
+            if additional_payload:
+                for key, value in additional_payload.items():
+                    payload_url = add_arg(payload_url, f"{key}={value}")
+
+        # Install the webhook
+        try:
+            error_msg = None
+            payload = {
+                "id": 0,
+                "method": "Webhook.Create",
+                "params": {
+                    "cid": component.get("ComponentIndex"),
+                    "enable": True,
+                    "event": event,
+                    "name": f"{component_name}: {event}",
+                    "urls": [str(payload_url)]
+                }
+            }
+            result, result_data = self._rpc_request(device, payload)
+            if result:
+                self._log_debug_message(f"Installed {event} webhook rev {result_data.get('rev')} for on component {component_name}")
+            else:
+                error_msg = f"Failed to create {event} webhook for component {component_name}: {result_data}"
+                self.logger.log_message(error_msg, "error")
+                # We will raise a RunTime error below
+
+        except TimeoutError as e:
+            error_msg = f"Timeout error installing web hooks for device {device.get('Name')}: {e}"
+            self.logger.log_message(error_msg, "error")
+            raise RuntimeError(error_msg) from e
+        except RuntimeError as e:
+            error_msg = f"Error installing web hooks for device {device.get('Name')}: {e}"
+            self.logger.log_message(error_msg, "error")
+            raise RuntimeError(error_msg) from e
+        if error_msg:
+            raise RuntimeError(error_msg)
+        return True
+
     def _get_default_webhook_events_for_component(self, component: dict) -> list[str]:
         """Get the default or configure webhook events for a specific component.
 
@@ -1223,6 +1350,7 @@ class ShellyControl:
         self.retry_count = settings.get("RetryCount", self.retry_count)  # Number of times to retry a request
         self.retry_delay = settings.get("RetryDelay", self.retry_delay)  # Number of seconds to wait between retries
         self.ping_allowed = settings.get("PingAllowed", True)  # Whether to allow pinging the devices
+        self.min_refresh_interval = settings.get("MinRefreshInterval", self.min_refresh_interval)  # Minimum number of seconds between device status refreshes
 
         # Folder for simulation files. Defaults to project root
         relative_folder = settings.get("SimulationFileFolder")
@@ -1248,6 +1376,22 @@ class ShellyControl:
                 self._add_device(device)
         except RuntimeError as e:
             raise RuntimeError(e) from e
+        finally:
+            self._build_component_index()
+
+    def _build_component_index(self) -> None:
+        """Rebuilds the lookup table used by get_device_component() to find a component by its ID or name.
+
+        The new table is built in full and then swapped in, so lookups made while this runs still see the previous one.
+        Where more than one component matches an identity, the first one in the list wins, as per a linear search.
+        """
+        component_index = {}
+        for component_type, component_list in (("input", self.inputs), ("output", self.outputs), ("meter", self.meters), ("temp_probe", self.temp_probes)):
+            lookup = component_index[component_type] = {}
+            for component in component_list:
+                lookup.setdefault(component["ID"], component)
+                lookup.setdefault(component["Name"], component)
+        self._component_index = component_index
 
     def _add_device(self, device_config: dict) -> None:
         """Adds a single switch to the list of switches.
@@ -1585,6 +1729,25 @@ class ShellyControl:
             new_component["RequiresOutput"] = None
         return new_component
 
+    @staticmethod
+    def _response_json(response: requests.Response) -> dict:
+        """Decode the JSON body of a device response, using orjson if it's available.
+
+        Anything orjson can't parse is handed to response.json() so that decode errors are raised exactly as before.
+
+        Args:
+            response (requests.Response): The response to decode.
+
+        Returns:
+            response_data (dict): The decoded JSON data.
+        """
+        if orjson is not None:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                pass
+        return response.json()
+
     def _rest_request(self, device: dict, url_args: str) -> tuple[bool, dict]:
         """Sends an REST GET request to a Shelly gen 1 device.
 
@@ -1618,7 +1781,7 @@ class ShellyControl:
         fatal_error = None
         while retry_count <= self.retry_count and fatal_error is None:
             try:
-                response = requests.get(
+                response = self._http.get(
                     url,
                     headers=headers,
                     timeout=self.response_timeout,
@@ -1627,7 +1790,7 @@ class ShellyControl:
                 if response.status_code != 200:
                     fatal_error = f"REST request to {device['Label']} returned status code {response.status_code}. Expected 200."
                     raise RuntimeError(fatal_error)
-                response_data = response.json()
+                response_data = self._response_json(response)
                 if not response_data:
                     fatal_error = f"REST request to {device['Label']} returned empty result."
                     raise RuntimeError(fatal_error)
@@ -1686,7 +1849,7 @@ class ShellyControl:
         fatal_error = None
         while retry_count <= self.retry_count and fatal_error is None:
             try:
-                response = requests.post(
+                response = self._http.post(
                     url,
                     headers=headers,
                     json=payload,
@@ -1699,7 +1862,7 @@ class ShellyControl:
                 if response.status_code != 200:
                     fatal_error = f"RPC request to {device['Label']} returned status code {response.status_code}. Expected 200."
                     raise RuntimeError(fatal_error)
-                response_payload = response.json()
+                response_payload = self._response_json(response)
                 response_data = response_payload.get("result", None)
                 if not response_data:   # If no results are returned, check for an error message
                     shelly_error_message = response_payload.get("error", {}).get("message", None)
@@ -9,8 +9,8 @@ yaml_config_validation = {
             "TimestampFormat": {"type": "string", "required": False, "nullable": True},
             "LogProcessID": {"type": "boolean", "required": False, "nullable": True},
             "LogThreadID": {"type": "boolean", "required": False, "nullable": True},
-            "LogfileVerbosity": {"type": "string", "required": True, "allowed": ["none", "error", "warning", "summary", "detailed", "debug", "all"]},
-            "ConsoleVerbosity": {"type": "string", "required": True, "allowed": ["error", "warning", "summary", "detailed", "debug"]},
+            "LogfileVerbosity": {"type": "string", "required": True, "allowed": frozenset({"none", "error", "warning", "summary", "detailed", "debug", "all"})},
+            "ConsoleVerbosity": {"type": "string", "required": True, "allowed": frozenset({"error", "warning", "summary", "detailed", "debug"})},
         },
     },
     "Email": {
@@ -33,6 +33,7 @@ yaml_config_validation = {
             "RetryCount": {"type": "number", "required": False, "nullable": True, "min": 0, "max": 10},
             "RetryDelay": {"type": "number", "required": False, "nullable": True, "min": 1, "max": 10},
             "PingAllowed": {"type": "boolean", "required": False, "nullable": True},
+            "MinRefreshInterval": {"type": "number", "required": False, "nullable": True, "min": 0, "max": 3600},
             "SimulationFileFolder": {"type": "string", "required": False, "nullable": True},
             "WebhooksEnabled": {"type": "boolean", "required": False, "nullable": True},
             "WebhookHost": {"type": "string", "required": False, "nullable": True},
@@ -1,6 +1,7 @@
 """WeatherClient main client module."""
 from __future__ import annotations
 
+import time
 from typing import TYPE_CHECKING
 
 from pyowm.commons.exceptions import UnauthorizedError
@@ -13,18 +14,21 @@ if TYPE_CHECKING:
 
 
 class WeatherClient:
-    def __init__(self, latitude: float, longitude: float, owm_api_key: str | None = None):
+    def __init__(self, latitude: float, longitude: float, owm_api_key: str | None = None, cache_ttl: float = 0):
         """Initialize the WeatherClient.
 
         Args:
             latitude: Latitude of the location to fetch weather for.
             longitude: Longitude of the location to fetch weather for.
             owm_api_key: Optional OpenWeatherMap API key for enhanced data.
+            cache_ttl: Optional number of seconds that get_weather() reuses the last result for before fetching again. 0 disables caching.
         """
         self.latitude = latitude
         self.longitude = longitude
         self._owm = OWMProvider(owm_api_key) if owm_api_key else None
         self._open_meteo = OpenMeteoProvider()
+        self.cache_ttl = cache_ttl
+        self._cache: dict[tuple[str | None, str | None], tuple[float, WeatherData]] = {}
 
     def get_weather(self, first_choice: str | None = None, owm_api_key: str | None = None) -> WeatherData:
         """Fetch weather data from providers, falling back as needed.
@@ -37,6 +41,9 @@ class WeatherClient:
         The preferred provider order can be influenced by the `first_choice` argument, but the method will automatically
         fall back to the next provider if the first choice fails for any reason (e.g., network error, API error, invalid API key).
 
+        If the client was created with a cache_ttl, a result fetched within the last cache_ttl seconds with the same
+        arguments is returned without calling the providers again.
+
         Args:
             first_choice(str | None): Optional string indicating the preferred weather provider ("owm" or "open_meteo").
             owm_api_key(str | None): Optional OpenWeatherMap API key to use for this fetch.
@@ -45,6 +52,31 @@ class WeatherClient:
         Raises:
             RuntimeError: If all providers fail to fetch weather data.
 
+        Returns:
+            A WeatherData object containing the current reading, list of hourly readings, and weather station info.
+        """
+        if self.cache_ttl <= 0:
+            return self._fetch_weather(first_choice, owm_api_key)
+
+        cache_key = (first_choice, owm_api_key)
+        cached = self._cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < self.cache_ttl:
+            return cached[1]
+
+        weather_data = self._fetch_weather(first_choice, owm_api_key)
+        self._cache[cache_key] = (time.monotonic(), weather_data)
+        return weather_data
+
+    def _fetch_weather(self, first_choice: str | None, owm_api_key: str | None) -> WeatherData:
+        """Fetch weather data from the providers, ignoring the cache. See get_weather() for details.
+
+        Args:
+            first_choice(str | None): Optional string indicating the preferred weather provider ("owm" or "open_meteo").
+            owm_api_key(str | None): Optional OpenWeatherMap API key to use for this fetch.
+
+        Raises:
+            RuntimeError: If all providers fail to fetch weather data.
+
         Returns:
             A WeatherData object containing the current reading, list of hourly readings, and weather station info.
         """
@@ -81,7 +113,8 @@ class WeatherClient:
         Returns:
             A WeatherData object containing the current reading, list of hourly readings, and weather station info.
         """
-        if owm_api_key:
+        # Only build a new provider (and its pyowm client) when the key actually changes
+        if owm_api_key and (self._owm is None or owm_api_key != self._owm.api_key):
             self._owm = OWMProvider(owm_api_key)
 
         if self._owm:
@@ -58,6 +58,11 @@ class OWMProvider:
         self._owm = OWM(api_key)
         self._mgr = self._owm.weather_manager()
 
+    @property
+    def api_key(self) -> str:
+        """The OpenWeatherMap API key this provider was created with."""
+        return self._api_key
+
     def fetch(self, lat: float, lon: float) -> WeatherData:  # noqa: PLR0914
         """Fetch weather data from OpenWeatherMap.
 
@@ -1,6 +1,8 @@
 """pytest for SCConfigManager class."""
 import sys
 
+import pytest
+
 from sc_utility import DateHelper, SCConfigManager
 
 # Remove the period if running this in the debugger
@@ -37,6 +39,25 @@ def test_get_value():
     assert value1 == value2, "Value1 and Value2 should be equal"
     assert string1 == string2, "String1 and String2 should be equal"
 
+    # Repeated lookups of a missing key should still honour each call's default
+    assert config.get("Testing", "NoSuchValue") is None, "Missing value should return None"
+    assert config.get("Testing", "NoSuchValue", default=42) == 42, "Missing value should return the default"
+
+    # Unhashable keys can't be in the config, so they should also return the default
+    assert config.get(["Files"], default=42) == 42, "Unhashable top level key should return the default"
+    assert config.get("Files", ["a"], default=42) == 42, "Unhashable nested key should return the default"
+
+    # Changes made to a section returned by get() should show up in later lookups
+    assert config.get("Files", "NewValue") is None, "NewValue should not be in the Files section yet"
+    files_section = config.get("Files")
+    files_section["NewValue"] = 1
+    try:
+        assert config.get("Files", "NewValue") == 1, "Value added to a section should be returned by get()"
+        files_section["NewValue"] = 2
+        assert config.get("Files", "NewValue") == 2, "Value changed in a section should be returned by get()"
+    finally:
+        del files_section["NewValue"]
+
     print("Configuration values read successfully:")
 
 
@@ -47,15 +68,52 @@ def test_load_config():
     print("Configuration loaded successfully.")
 
 
+def test_skip_validation(tmp_path):
+    """Test that skip_validation loads a config file that would otherwise fail validation."""
+    invalid_config_file = tmp_path / "invalid_config.yaml"
+    invalid_config_file.write_text("Files:\n  LogfileVerbosity: not_a_level\n  ConsoleVerbosity: summary\n", encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="Validation error"):
+        SCConfigManager(config_file=str(invalid_config_file))
+
+    lax_config = SCConfigManager(config_file=str(invalid_config_file), skip_validation=True)
+    assert lax_config.get("Files", "LogfileVerbosity") == "not_a_level", "Config should load without validation"
+
+
+def test_lazy_load(tmp_path):
+    """Test that lazy_load defers loading, and any load errors, until the config is first read."""
+    invalid_config_file = tmp_path / "invalid_config.yaml"
+    invalid_config_file.write_text("Files:\n  LogfileVerbosity: not_a_level\n  ConsoleVerbosity: summary\n", encoding="utf-8")
+
+    lazy_config = SCConfigManager(config_file=str(invalid_config_file), lazy_load=True)
+    with pytest.raises(RuntimeError, match="Validation error"):
+        lazy_config.get("Files", "LogfileVerbosity")
+
+
+def test_default_config_placeholders(tmp_path):
+    """Test that writing a default config that still contains placeholders raises a placeholder error."""
+    new_config_file = tmp_path / "new_config.yaml"
+    with pytest.raises(RuntimeError, match="Placeholder value"):
+        SCConfigManager(config_file=str(new_config_file), default_config=schemas.default, placeholders=schemas.placeholders)
+    assert new_config_file.exists(), "Default config file was not written"
+
+
 def test_check_for_config_changes():
     """Test checking for changes in the configuration file."""
     # Create a fake last check time well in the past
     last_check = DateHelper.add(DateHelper.now(), days=-365)
     assert config.check_for_config_changes(last_check) is not None, "Configuration changes were not detected"
+    assert config.check_for_config_changes(DateHelper.now()) is None, "Unchanged configuration was reported as changed"
 
     print("Configuration changes detected successfully.")
 
 
+def test_get_changed_sections():
+    """Test that reloading an unchanged configuration file reports no changed sections."""
+    assert config.load_config(), "Failed to load configuration"
+    assert config.get_changed_sections() == set(), "Unchanged configuration sections were reported as changed"
+
+
 def test_register_logger():
     """Test registering a logger with the configuration manager will be tested in test_sc_logging."""
     # Nothing to do here.
@@ -9,6 +9,7 @@ import pytest
 from sc_utility import DateHelper, SCCommon
 
 CONFIG_FILE = "tests/config.yaml"
+LOCAL_TZ = dt.datetime.now().astimezone().tzinfo
 
 
 def test_add():
@@ -83,6 +84,13 @@ def test_extract():
     assert isinstance(DateHelper.extract_datetime(datetime_str), dt.datetime), "Should return a datetime object when format_str indicates a datetime"
     assert isinstance(DateHelper.extract_time(time_str), dt.time), "Should return a time object when format_str indicates a time"
 
+    # Batch extraction should match extracting each string individually
+    batch_strs = [date_str, datetime_str, datetime_with_tz_str, time_str, time_with_ms_str, date_str]
+    assert DateHelper.extract_many(batch_strs) == [DateHelper.extract(s) for s in batch_strs], "Batch extraction should match individual extraction"
+    assert DateHelper.extract_many([date_str, "2025-2-5"], dt_type=dt.date) == [dt.date(2025, 2, 4), dt.date(2025, 2, 5)], "Batch extraction should honour dt_type"
+    with pytest.raises(ValueError, match="Could not parse"):
+        DateHelper.extract_many([date_str, "not a date"])
+
 
 def test_add_timezone():
     """Test adding timezone to a datetime."""
@@ -107,12 +115,20 @@ def test_days_between():
     assert DateHelper.days_between(d1, d2) == 9, "Days between 2024-01-01 and 2024-01-10 should be 9"
 
 
+def test_fixed_offset():
+    """Test fixed_offset() returns the same cached timezone for the same offset."""
+    tz = DateHelper.fixed_offset(600)
+    assert tz == dt.timezone(dt.timedelta(hours=10)), "Offset of 600 minutes should be UTC+10:00"
+    assert DateHelper.fixed_offset(600) is tz, "Timezone for the same offset should be reused"
+    assert DateHelper.fixed_offset(-90).utcoffset(None) == dt.timedelta(minutes=-90), "Negative offsets should be supported"
+
+
 def test_get_file_date():
     """Test getting the file date."""
     file_path = Path(CONFIG_FILE)
     file_date = DateHelper.get_file_date(CONFIG_FILE)
 
-    local_tz = dt.datetime.now().astimezone().tzinfo
+    local_tz = LOCAL_TZ
     check_file_date = dt.datetime.fromtimestamp(file_path.stat().st_mtime, tz=local_tz).date()
     assert file_date == check_file_date, "File date should match the last modified date of the file"
 
@@ -122,7 +138,7 @@ def test_get_file_datetime():
     file_path = Path(CONFIG_FILE)
     file_date = DateHelper.get_file_datetime(CONFIG_FILE)
 
-    local_tz = dt.datetime.now().astimezone().tzinfo
+    local_tz = LOCAL_TZ
     check_file_datetime = dt.datetime.fromtimestamp(file_path.stat().st_mtime, tz=local_tz)
     assert file_date == check_file_datetime, "File datetime should match the last modified datetime of the file"
 
@@ -130,7 +146,7 @@ def test_get_file_datetime():
 def test_get_local_timezone():
     """Test getting the local timezone."""
     local_tz = DateHelper.get_local_timezone()
-    expected_tz = dt.datetime.now().astimezone().tzinfo
+    expected_tz = LOCAL_TZ
     assert local_tz == expected_tz, "Local timezone should match the system's local timezone"
 
 
@@ -140,6 +156,9 @@ def test_is_valid_date():
     datetime_str = "2025-05-04 12:10:08"
     assert DateHelper.is_valid_date(date_str, "%Y-%m-%d"), "Date '2025-05-04' should be valid"
     assert DateHelper.is_valid_date(datetime_str, "%Y-%m-%d %H:%M:%S"), "Datetime '2025-05-04  12:10:08' should be valid"
+    assert not DateHelper.is_valid_date("2025-02-30", "%Y-%m-%d"), "Date '2025-02-30' should be invalid"
+    assert not DateHelper.is_valid_date("2025-05-04x", "%Y-%m-%d"), "Date '2025-05-04x' should be invalid"
+    assert DateHelper.is_valid_date("2025-05- 4", "%Y-%m-%d"), "Date '2025-05- 4' with a space padded day should be valid"
 
 
 def test_is_valid_datetime():
@@ -148,17 +167,20 @@ def test_is_valid_datetime():
     datetime_str = "2025-05-04 12:10:08"
     assert DateHelper.is_valid_datetime(date_str, "%Y-%m-%d"), "Date '2025-05-04' should be valid as datetime"
     assert DateHelper.is_valid_datetime(datetime_str, "%Y-%m-%d %H:%M:%S"), "Datetime '2025-05-04  12:10:08' should be valid"
+    assert not DateHelper.is_valid_datetime("2025-05-04 24:10:08", "%Y-%m-%d %H:%M:%S"), "Datetime '2025-05-04 24:10:08' should be invalid"
+    assert DateHelper.is_valid_datetime("2025-05- 4 10:00:00", "%Y-%m-%d %H:%M:%S"), "Datetime '2025-05- 4 10:00:00' with a space padded day should be valid"
 
 
 def test_is_valid_time():
     """Test is_valid_time."""
     time_str = "12:10:08"
     assert DateHelper.is_valid_time(time_str, "%H:%M:%S"), "Time '12:10:08' should be valid"
+    assert not DateHelper.is_valid_time("12:60:08", "%H:%M:%S"), "Time '12:60:08' should be invalid"
 
 
 def test_now():
     """Test today()."""
-    local_tz = dt.datetime.now().astimezone().tzinfo
+    local_tz = LOCAL_TZ
     time_now = dt.datetime.now(tz=local_tz)
     time_now_str = DateHelper.format(time_now, "%Y-%m-%d %H:%M")
     func_time_now_str = DateHelper.format(DateHelper.now(), "%Y-%m-%d %H:%M")
@@ -241,7 +263,7 @@ def test_frozen_now():
 
 def test_now_str():
     """Test getting string representation of the current time."""
-    local_tz = dt.datetime.now().astimezone().tzinfo
+    local_tz = LOCAL_TZ
     time_now = dt.datetime.now(tz=local_tz)
     time_str = DateHelper.format(time_now, "%Y-%m-%d %H:%M")
     formatted_now = DateHelper.format(DateHelper.now(), "%Y-%m-%d %H:%M")
@@ -263,7 +285,7 @@ def test_today_add_days():
 
 def test_today():
     """Test today()."""
-    local_tz = dt.datetime.now().astimezone().tzinfo
+    local_tz = LOCAL_TZ
     today_date = dt.datetime.now(tz=local_tz).date()
     assert DateHelper.today() == today_date, "Today should return the current date"
 
@@ -285,6 +307,7 @@ def test_today_utc():
 # test_format()
 # test_extract()
 # test_add_timezone()
+# test_fixed_offset()
 # test_get_file_date()
 # test_get_file_datetime()
 # test_get_local_timezone()
@@ -1,5 +1,6 @@
 """pytest for SCLogger class."""
 import sys
+import threading
 
 from sc_utility import SCCommon, SCConfigManager, SCLogger
 
@@ -83,4 +84,21 @@ def test_send_email():
         print("No email settings found in the configuration, skipping email test.")
 
 
+def test_wait_notifiable_issue():
+    """Test waiting for a notifiable issue."""
+    entity = "Test Entity"
+    issue_type = "Test issue"
+    message = "This is a test notifiable issue."
+
+    assert not logger.wait_notifiable_issue(entity, issue_type, message), "Waiting for an unreported issue should return False."
+
+    assert not logger.report_notifiable_issue(entity, issue_type, 3600, message), "First report of an issue should not send an email."
+
+    wake_event = threading.Event()
+    wake_event.set()
+    assert not logger.wait_notifiable_issue(entity, issue_type, message, wake_event=wake_event), "An interrupted wait should return False."
+
+    assert logger.clear_notifiable_issue(entity, issue_type), "Issue should have been cleared."
+
+
 # test_register_email_settings()
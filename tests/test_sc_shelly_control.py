@@ -1,6 +1,9 @@
 """pytest for ShellyControl class."""
+import asyncio
 import sys
 
+import pytest
+
 from sc_utility import SCConfigManager, SCLogger, ShellyControl
 
 # Remove the period if running this in the debugger
@@ -115,6 +118,30 @@ def test_get_device_status():
     assert device_meter is not None, "Device meter should be found"
 
 
+def test_get_device_component_lookup():
+    """Test looking up device components by ID and name, with and without the component lookup table."""
+    assert shelly_control is not None, "ShellyControl should be initialized"
+    device_output = shelly_control.get_device_component("output", "Device 1.Output 2")
+    assert device_output["Name"] == "Device 1.Output 2", "Output should be found by name"
+    assert shelly_control.get_device_component("output", device_output["ID"]) is device_output, "Output should be found by ID"
+
+    with pytest.raises(RuntimeError, match="Invalid component type 'switch'"):
+        shelly_control.get_device_component("switch", "Device 1.Output 2")
+    with pytest.raises(RuntimeError, match="Device component output with identity No Such Output not found"):
+        shelly_control.get_device_component("output", "No Such Output")
+
+    # Before the lookup table is built, lookups should fall back to searching the component lists
+    saved_index = shelly_control._component_index  # noqa: SLF001
+    shelly_control._component_index = {}  # noqa: SLF001
+    try:
+        assert shelly_control.get_device_component("output", "Device 1.Output 2") is device_output, "Output should be found by name without the lookup table"
+        assert shelly_control.get_device_component("output", device_output["ID"]) is device_output, "Output should be found by ID without the lookup table"
+        with pytest.raises(RuntimeError, match="Device component output with identity No Such Output not found"):
+            shelly_control.get_device_component("output", "No Such Output")
+    finally:
+        shelly_control._component_index = saved_index  # noqa: SLF001
+
+
 def test_refresh_all_device_statuses():
     """Test function for refreshing all device statuses."""
     assert shelly_control is not None, "ShellyControl should be initialized"
@@ -125,6 +152,39 @@ def test_refresh_all_device_statuses():
         sys.exit(1)
 
 
+def test_refresh_all_device_statuses_async():
+    """Test function for refreshing all device statuses from an asyncio event loop."""
+    assert shelly_control is not None, "ShellyControl should be initialized"
+    try:
+        asyncio.run(shelly_control.refresh_all_device_statuses_async())
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+
+def test_refresh_all_device_statuses_debounce():
+    """Test that MinRefreshInterval skips refreshes that are too soon after the last one."""
+    assert shelly_control is not None, "ShellyControl should be initialized"
+    saved_interval = shelly_control.min_refresh_interval
+    shelly_control.min_refresh_interval = 3600
+    shelly_control._last_refresh_time = None  # noqa: SLF001
+    try:
+        shelly_control.refresh_all_device_statuses()
+        first_refresh_time = shelly_control._last_refresh_time  # noqa: SLF001
+        assert first_refresh_time is not None, "First refresh should always run"
+
+        shelly_control.refresh_all_device_statuses()
+        assert shelly_control._last_refresh_time == first_refresh_time, "Refresh within MinRefreshInterval should be skipped"  # noqa: SLF001
+
+        shelly_control.refresh_all_device_statuses(force=True)
+        assert shelly_control._last_refresh_time != first_refresh_time, "Forced refresh should ignore MinRefreshInterval"  # noqa: SLF001
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+    finally:
+        shelly_control.min_refresh_interval = saved_interval
+
+
 def test_is_device_online():
     """Test function for checking if a device is online."""
     assert shelly_control is not None, "ShellyControl should be initialized"
@@ -184,6 +244,18 @@ def test_change_output():
         assert new_state != current_state, "Output state should be changed"
 
 
+def test_pull_webhook_event():
+    """Test that queued webhook events are pulled in the order they arrived."""
+    shelly_control._push_webhook_event({"Event": ["input.toggle_on"]})  # noqa: SLF001
+    shelly_control._push_webhook_event({"Event": ["input.toggle_off"]})  # noqa: SLF001
+
+    first_event = shelly_control.pull_webhook_event()
+    second_event = shelly_control.pull_webhook_event()
+    assert first_event is not None and first_event["Event"] == "input.toggle_on", "First event should be input.toggle_on"
+    assert second_event is not None and second_event["Event"] == "input.toggle_off", "Second event should be input.toggle_off"
+    assert shelly_control.pull_webhook_event() is None, "Queue should be empty"
+
+
 test_get_device()
 test_get_device_information()
 test_get_device_status()